@@ -29,16 +29,19 @@ ROOK_VALUE: int = 500
 QUEEN_VALUE: int = 900
 KING_VALUE: int = 20_000  # Not used in material counting; guards against king trades
 
-# Mapping from python-chess piece type constants to centipawn values.
-# Used by the evaluation function and MVV-LVA move ordering.
-PIECE_VALUES: dict[int, int] = {
-    chess.PAWN:   PAWN_VALUE,
-    chess.KNIGHT: KNIGHT_VALUE,
-    chess.BISHOP: BISHOP_VALUE,
-    chess.ROOK:   ROOK_VALUE,
-    chess.QUEEN:  QUEEN_VALUE,
-    chess.KING:   KING_VALUE,
-}
+# Centipawn values indexed by python-chess piece type. chess.PAWN == 1
+# through chess.KING == 6, so index 0 is an unused placeholder. A tuple
+# indexed by int is several times faster than a dict lookup in CPython,
+# and MVV-LVA move ordering hits this table twice per capture per node.
+PIECE_VALUES: tuple[int, ...] = (
+    0,
+    PAWN_VALUE,
+    KNIGHT_VALUE,
+    BISHOP_VALUE,
+    ROOK_VALUE,
+    QUEEN_VALUE,
+    KING_VALUE,
+)
 
 # ---------------------------------------------------------------------------
 # Special scores
@@ -50,6 +53,11 @@ PIECE_VALUES: dict[int, int] = {
 CHECKMATE_SCORE: int = 99_999  # Returned when the opponent is checkmated
 DRAW_SCORE: int = 0            # Stalemate, repetition, 50-move rule
 
+# Scores beyond this magnitude are mate scores. Mate scores encode distance
+# to mate (CHECKMATE_SCORE - ply) and must be re-based relative to the
+# current node when passing through the transposition table.
+MATE_SCORE_THRESHOLD: int = CHECKMATE_SCORE - 1_000
+
 # ---------------------------------------------------------------------------
 # Search parameters
 # ---------------------------------------------------------------------------
@@ -62,6 +70,25 @@ MAX_DEPTH: int = 64
 # rarely means we blow the time budget. 2048 is a good balance.
 TIME_CHECK_NODES: int = 2_048
 
+# MVV-LVA move-ordering table, precomputed so scoring a capture is a single
+# double index instead of two value lookups and three arithmetic ops per
+# move per node. MVV_LVA[victim][attacker] ranks captures of valuable
+# victims by cheap attackers highest; the victim is weighted 10x so it
+# always dominates the attacker. Row/column 0 are unused placeholders
+# (piece types are 1..6); en-passant captures, whose victim square reads
+# as empty, map to the pawn row via `victim or chess.PAWN` at call sites.
+MVV_LVA: list[list[int]] = [
+    [10_000 + victim_value * 10 - attacker_value for attacker_value in PIECE_VALUES]
+    for victim_value in PIECE_VALUES
+]
+
+# ASPIRATION_WINDOW: half-width (centipawns) of the aspiration window used
+# by iterative deepening. Each depth first searches a narrow window around
+# the previous depth's score — most iterations land inside it and enjoy
+# far more cutoffs. Half a pawn is the conventional starting width: wide
+# enough that quiet positions rarely fail, narrow enough to matter.
+ASPIRATION_WINDOW: int = 50
+
 # NULL_MOVE_REDUCTION: depth reduction for null-move pruning (R=3).
 # When we skip our turn and the position is still bad for the opponent,
 # we prune the branch. R=3 is standard for depths >= 4.
@@ -75,6 +102,15 @@ NULL_MOVE_REDUCTION: int = 3
 # This is a reasonable budget for a laptop chess engine.
 TT_SIZE: int = 1 << 20  # 1,048,576 entries
 
+# ---------------------------------------------------------------------------
+# Evaluation cache
+# ---------------------------------------------------------------------------
+# EVAL_CACHE_SIZE: maximum number of cached static evaluations
+# (see engine/evaluate.py). 2^18 entries keeps the cache well under the
+# transposition table's memory budget while covering the leaf positions
+# of a typical 5-second search many times over.
+EVAL_CACHE_SIZE: int = 1 << 18  # 262,144 entries
+
 # ---------------------------------------------------------------------------
 # Time management
 # ---------------------------------------------------------------------------
@@ -225,6 +261,21 @@ PST: dict[int, tuple[list[int], list[int]]] = {
     chess.KING:   (MG_KING_TABLE,   EG_KING_TABLE),
 }
 
+# Combined piece-square tables: the piece's material value is folded into
+# every square's positional bonus at import time, so the evaluation loop
+# does ONE table lookup per piece instead of a lookup plus a material add.
+# The king folds 0 material (it is never traded; KING_VALUE exists only
+# for move ordering), which also removes the king special-case branch
+# from the evaluation loop.
+PST_MG: dict[int, list[int]] = {
+    pt: [bonus + (0 if pt == chess.KING else PIECE_VALUES[pt]) for bonus in mg_table]
+    for pt, (mg_table, _eg_table) in PST.items()
+}
+PST_EG: dict[int, list[int]] = {
+    pt: [bonus + (0 if pt == chess.KING else PIECE_VALUES[pt]) for bonus in eg_table]
+    for pt, (_mg_table, eg_table) in PST.items()
+}
+
 # Phase weights for tapered evaluation. Non-pawn material counts toward
 # the game phase score. Max phase = 24 (2 queens + 4 rooks + 4 bishops + 4 knights).
 PHASE_WEIGHTS: dict[int, int] = {
@@ -22,11 +22,29 @@ The score is always returned from the perspective of the side to move. This is
 the negamax convention: the search always tries to maximize the score, and a
 positive score means the current side is ahead. The caller negates the score
 when recursing, so the convention propagates automatically.
+
+Incremental evaluation:
+    Recomputing the (mg, eg, phase) terms from scratch is O(pieces) per call,
+    but a single move only touches two or three squares. The search therefore
+    maintains the terms incrementally: eval_terms() computes the full terms
+    once at the root, move_terms_delta() returns the change a move makes
+    (computed BEFORE the move is pushed), and tapered_score() turns terms
+    into a centipawn score. evaluate() remains the one-shot entry point for
+    callers outside the search (web API, tools).
 """
 
 import chess
 
-from engine.constants import PIECE_VALUES, PST, PHASE_WEIGHTS, MAX_PHASE
+from engine.constants import EVAL_CACHE_SIZE, PST_MG, PST_EG, PHASE_WEIGHTS, MAX_PHASE
+
+# Evaluation cache: maps position key -> White-relative tapered score.
+# The same position is evaluated repeatedly — transpositions reach identical
+# leaves through different move orders, and the transposition table's bound
+# entries re-enter quiescence on re-search. A hit skips the 64-square loop
+# entirely. Keys come from Board._transposition_key(), which python-chess
+# maintains incrementally. Eviction is FIFO: dicts preserve insertion order,
+# so popping the first key drops the oldest entry in O(1).
+_EVAL_CACHE: dict[object, int] = {}
 
 
 def evaluate(board: chess.Board) -> int:
@@ -54,39 +72,94 @@ def evaluate(board: chess.Board) -> int:
         >>> evaluate(b)  # starting position should be approximately equal
         0
     """
-    mg_score = 0  # middlegame score accumulated (White minus Black)
-    eg_score = 0  # endgame score accumulated (White minus Black)
-    phase = 0     # game phase: 0 = full endgame, MAX_PHASE = full middlegame
+    # Cache probe: the cached value is White-relative (pre-negation) so one
+    # entry serves regardless of which side asks.
+    key = board._transposition_key()
+    cached = _EVAL_CACHE.get(key)
+    if cached is not None:
+        return cached if board.turn == chess.WHITE else -cached
+
+    mg_score, eg_score, phase = eval_terms(board)
+    tapered = tapered_score(mg_score, eg_score, phase, chess.WHITE)
+
+    # Cache the White-relative score, evicting the oldest entry when full.
+    if len(_EVAL_CACHE) >= EVAL_CACHE_SIZE:
+        del _EVAL_CACHE[next(iter(_EVAL_CACHE))]
+    _EVAL_CACHE[key] = tapered
+
+    # Convert to side-to-move perspective (negamax convention).
+    return tapered if board.turn == chess.WHITE else -tapered
+
 
-    for sq in chess.SQUARES:
-        piece = board.piece_at(sq)
-        if piece is None:
-            continue
+def eval_terms(board: chess.Board) -> tuple[int, int, int]:
+    """
+    Compute the raw evaluation terms (mg, eg, phase) from scratch.
+
+    The terms are White-relative running sums: mg and eg accumulate the
+    combined material+PST score of every piece for the middlegame and
+    endgame tables respectively, and phase accumulates the game-phase
+    weights of the remaining pieces. tapered_score() blends them into a
+    final centipawn score.
 
-        pt = piece.piece_type
-        mg_table, eg_table = PST[pt]
+    The search calls this once per root position and then maintains the
+    terms incrementally via move_terms_delta() — do not call it per node.
 
-        # King material value is excluded from positional scoring — the king is
-        # never traded, so its "value" is only used for move ordering. Only the
-        # PST bonus applies for king placement.
-        material = 0 if pt == chess.KING else PIECE_VALUES[pt]
+    Args:
+        board: The current board position. Not modified.
 
-        if piece.color == chess.WHITE:
+    Returns:
+        Tuple (mg_score, eg_score, phase), all White-relative ints.
+    """
+    mg_score = 0  # middlegame score accumulated (White minus Black)
+    eg_score = 0  # endgame score accumulated (White minus Black)
+    phase = 0     # game phase: 0 = full endgame, MAX_PHASE = full middlegame
+
+    # Iterate only the occupied squares by scanning the occupancy bitboard,
+    # instead of visiting all 64 squares and testing each for a piece. With
+    # ~32 pieces on the board this halves the loop iterations, and
+    # piece_type_at() returns a plain int — unlike piece_at(), it allocates
+    # no chess.Piece object, so the hot path creates no garbage.
+    white_occupied = board.occupied_co[chess.WHITE]
+    bb_squares = chess.BB_SQUARES
+
+    for sq in chess.scan_forward(board.occupied):
+        pt = board.piece_type_at(sq)
+
+        # PST_MG/PST_EG have the piece's material value pre-folded into every
+        # square (0 for the king, which is never traded), so a single table
+        # lookup covers both material and positional scoring.
+        if white_occupied & bb_squares[sq]:
             # Mirror the square vertically: PST row 0 = rank 8 (visual top),
             # but python-chess square 0 = a1 (rank 1). XOR with 56 flips the rank.
             idx = sq ^ 56
-            mg_score += material + mg_table[idx]
-            eg_score += material + eg_table[idx]
+            mg_score += PST_MG[pt][idx]
+            eg_score += PST_EG[pt][idx]
         else:
             # Black pieces: use the square directly (PST is written from Black's
             # perspective already — index 0 = a8 corresponds to a8 for Black).
-            idx = sq
-            mg_score -= material + mg_table[idx]
-            eg_score -= material + eg_table[idx]
+            mg_score -= PST_MG[pt][sq]
+            eg_score -= PST_EG[pt][sq]
 
         # Accumulate phase counter from non-pawn, non-king pieces.
-        phase += PHASE_WEIGHTS.get(pt, 0)
+        phase += PHASE_WEIGHTS[pt]
+
+    return mg_score, eg_score, phase
 
+
+def tapered_score(mg_score: int, eg_score: int, phase: int, turn: chess.Color) -> int:
+    """
+    Blend raw evaluation terms into a centipawn score for the side to move.
+
+    Args:
+        mg_score: White-relative middlegame term (see eval_terms).
+        eg_score: White-relative endgame term.
+        phase:    Game-phase counter (0 = bare endgame, MAX_PHASE = opening).
+        turn:     The side to move; the White-relative blend is negated for
+                  Black (negamax convention).
+
+    Returns:
+        Centipawn score from the perspective of the side to move.
+    """
     # Clamp phase to MAX_PHASE (a double queen promotion could theoretically exceed it).
     phase = min(phase, MAX_PHASE)
 
@@ -94,5 +167,81 @@ def evaluate(board: chess.Board) -> int:
     # Uses integer arithmetic throughout (no floats).
     tapered = (mg_score * phase + eg_score * (MAX_PHASE - phase)) // MAX_PHASE
 
-    # Convert to side-to-move perspective (negamax convention).
-    return tapered if board.turn == chess.WHITE else -tapered
+    return tapered if turn == chess.WHITE else -tapered
+
+
+def move_terms_delta(board: chess.Board, move: chess.Move) -> tuple[int, int, int]:
+    """
+    Compute how a move changes the (mg, eg, phase) evaluation terms.
+
+    Must be called BEFORE board.push(move): the deltas are derived from the
+    pre-move piece placement (which piece moves, what it captures, whether
+    the move castles or promotes). The caller adds the deltas to its running
+    terms and pushes the move; popping the move simply discards the updated
+    terms. A move touches at most four squares (castling: king + rook), so
+    this is O(1) versus eval_terms' O(pieces).
+
+    Args:
+        board: The position the move will be played in. Not modified.
+        move:  A legal move (null moves change nothing and must be handled
+               by the caller).
+
+    Returns:
+        Tuple (mg_delta, eg_delta, phase_delta) to add to the current terms.
+    """
+    from_sq = move.from_square
+    to_sq = move.to_square
+    pt = board.piece_type_at(from_sq)
+    is_white = board.turn == chess.WHITE
+    mg_delta = 0
+    eg_delta = 0
+    phase_delta = 0
+
+    # --- Captured piece leaves the board (including en passant) ---
+    if board.is_en_passant(move):
+        # The captured pawn is behind the destination square, not on it.
+        cap_sq = to_sq - 8 if is_white else to_sq + 8
+        cap_pt: int | None = chess.PAWN
+    else:
+        cap_sq = to_sq
+        cap_pt = board.piece_type_at(to_sq)
+
+    if cap_pt is not None:
+        # Remove the opponent's piece: White loses a negative contribution
+        # (delta increases), Black loses a positive one (delta decreases).
+        if is_white:
+            mg_delta += PST_MG[cap_pt][cap_sq]
+            eg_delta += PST_EG[cap_pt][cap_sq]
+        else:
+            idx = cap_sq ^ 56
+            mg_delta -= PST_MG[cap_pt][idx]
+            eg_delta -= PST_EG[cap_pt][idx]
+        phase_delta -= PHASE_WEIGHTS[cap_pt]
+
+    # --- The moving piece: leaves from_sq, lands on to_sq ---
+    # A promotion changes the piece type on arrival (and the game phase).
+    final_pt = move.promotion if move.promotion else pt
+    if final_pt != pt:
+        phase_delta += PHASE_WEIGHTS[final_pt]
+
+    if is_white:
+        mg_delta += PST_MG[final_pt][to_sq ^ 56] - PST_MG[pt][from_sq ^ 56]
+        eg_delta += PST_EG[final_pt][to_sq ^ 56] - PST_EG[pt][from_sq ^ 56]
+    else:
+        mg_delta -= PST_MG[final_pt][to_sq] - PST_MG[pt][from_sq]
+        eg_delta -= PST_EG[final_pt][to_sq] - PST_EG[pt][from_sq]
+
+    # --- Castling also moves the rook ---
+    if pt == chess.KING and board.is_castling(move):
+        if chess.square_file(to_sq) == 6:  # Kingside: rook h-file -> f-file
+            rook_from, rook_to = to_sq + 1, to_sq - 1
+        else:                              # Queenside: rook a-file -> d-file
+            rook_from, rook_to = to_sq - 2, to_sq + 1
+        if is_white:
+            mg_delta += PST_MG[chess.ROOK][rook_to ^ 56] - PST_MG[chess.ROOK][rook_from ^ 56]
+            eg_delta += PST_EG[chess.ROOK][rook_to ^ 56] - PST_EG[chess.ROOK][rook_from ^ 56]
+        else:
+            mg_delta -= PST_MG[chess.ROOK][rook_to] - PST_MG[chess.ROOK][rook_from]
+            eg_delta -= PST_EG[chess.ROOK][rook_to] - PST_EG[chess.ROOK][rook_from]
+
+    return mg_delta, eg_delta, phase_delta
@@ -25,32 +25,42 @@ v4 implementation adds four improvements over v3:
 4. Iterative deepening: the engine searches depth 1, 2, 3, ... until time runs out.
    Each completed iteration provides a valid move to return if interrupted. Deeper
    iterations also benefit from the move ordering hints from shallower searches
-   (though we haven't added TT best-move ordering yet).
+   via the transposition table's cached best moves.
 
 Threading model:
     The UCI handler starts get_best_move() in a daemon thread. The stop_event
     is set when the GUI sends "stop" or when the time budget expires. The search
-    checks stop_event at each node and returns immediately when it is set.
+    polls stop_event every TIME_CHECK_NODES nodes and unwinds the whole tree
+    with a SearchAborted exception when it is set.
 """
 
 import time
 import threading
 from dataclasses import dataclass, field
-from typing import Iterable
+from typing import Iterator
 
 import chess
 
 from engine.constants import (
+    ASPIRATION_WINDOW,
     CHECKMATE_SCORE,
+    MATE_SCORE_THRESHOLD,
     MAX_DEPTH,
-    PIECE_VALUES,
+    MVV_LVA,
+    NULL_MOVE_REDUCTION,
     TIME_CHECK_NODES,
     TIME_USAGE_FRACTION,
 )
-from engine.evaluate import evaluate
+from engine.evaluate import eval_terms, move_terms_delta, tapered_score
+from engine.transposition import EXACT, LOWERBOUND, UPPERBOUND, TranspositionTable
 
+# Shared transposition table. Module-level so cached results persist across
+# moves within a game (knowledge from the previous search seeds the next
+# one). interface/uci.py clears it on "ucinewgame".
+transposition_table = TranspositionTable()
 
-@dataclass
+
+@dataclass(slots=True)
 class SearchState:
     """
     Mutable state shared between the search thread and the UCI handler.
@@ -59,6 +69,10 @@ class SearchState:
     makes the threading model explicit and testable. The UCI handler owns
     this object; the search function reads from and writes to it.
 
+    slots=True stores fields in fixed slots instead of a per-instance
+    __dict__: attribute accesses like state.node_count += 1 happen on every
+    node, and the slot path skips the dict lookup.
+
     Attributes:
         stop_event:     Threading event set by the UCI "stop" command or when
                         the time budget expires. The search checks this flag
@@ -76,52 +90,301 @@ class SearchState:
                         perspective.
         start_time:     Monotonic clock timestamp when the search began.
                         Used for time management checks.
+        killers:        Killer move slots: quiet moves that caused a beta
+                        cutoff at the same ply in a sibling node. A flat list
+                        indexed by ply, each entry holding [primary, secondary]
+                        — no hashing, just two list indexes per lookup.
+        history:        History heuristic table: a flat list of 64*64 scores
+                        indexed by from_square*64 + to_square. Quiet moves that
+                        cause beta cutoffs anywhere in the tree gain
+                        depth*depth, so moves that are repeatedly good get
+                        searched earlier.
+        eval_terms_stack: Incrementally maintained (mg, eg, phase) evaluation
+                        terms, one entry per ply, aligned with the board's
+                        push/pop stack. The top entry always describes the
+                        current position, so quiescence's stand-pat score is
+                        an O(1) blend instead of a full board scan. Seeded
+                        from eval_terms(board) by get_best_move.
+        scratch_captures / scratch_scores / scratch_quiets:
+                        Per-ply reusable lists for move ordering. Allocating
+                        fresh lists at every interior node is pure allocator
+                        churn; each ply instead clears and refills its own
+                        scratch lists (only one node per ply is ever being
+                        ordered at a time on a single-threaded search).
     """
 
     stop_event: threading.Event = field(default_factory=threading.Event)
     time_limit_ms: float = float("inf")
     node_count: int = 0
+    nodes_until_check: int = TIME_CHECK_NODES
     best_move: chess.Move | None = None
     best_score: int = 0
     start_time: float = field(default_factory=time.monotonic)
+    killers: list[list[chess.Move | None]] = field(
+        default_factory=lambda: [[None, None] for _ in range(MAX_DEPTH + 1)]
+    )
+    history: list[int] = field(default_factory=lambda: [0] * (64 * 64))
+    eval_terms_stack: list[tuple[int, int, int]] = field(default_factory=list)
+    scratch_captures: list[list[chess.Move]] = field(
+        default_factory=lambda: [[] for _ in range(MAX_DEPTH + 1)]
+    )
+    scratch_scores: list[list[int]] = field(
+        default_factory=lambda: [[] for _ in range(MAX_DEPTH + 1)]
+    )
+    scratch_quiets: list[list[chess.Move]] = field(
+        default_factory=lambda: [[] for _ in range(MAX_DEPTH + 1)]
+    )
+
+
+def _staged_moves(
+    board: chess.Board,
+    moves: list[chess.Move],
+    state: SearchState,
+    ply: int,
+    tt_move: chess.Move | None,
+) -> Iterator[chess.Move]:
+    """
+    Yield moves best-first, doing only as much ordering work as consumed.
+
+    With good ordering, the first move causes a beta cutoff at most interior
+    nodes — so fully sorting the move list is usually wasted work. This
+    generator produces moves in stages and defers each stage's cost until a
+    move from it is actually requested:
+
+        1. The transposition-table best move: yielded immediately, before
+           any other move is even classified.
+        2. Captures, best-first by MVV-LVA (Most Valuable Victim - Least
+           Valuable Aggressor: PxQ before QxP), via selection picking — each
+           yield scans the remaining captures for the maximum, O(n) per
+           yielded capture instead of O(n log n) to sort them all.
+        3. Quiet moves: the two killer moves for this ply (quiet moves that
+           caused a beta cutoff in a sibling node), then the rest ordered by
+           history score. The history sort only happens if the search
+           actually exhausts the killers without a cutoff.
+
+    A beta cutoff simply stops iterating; the generator is discarded with
+    the unexamined remainder never scored or sorted.
+
+    Args:
+        board:   The current board position (used to look up piece types).
+        moves:   The legal moves for this node.
+        state:   Search state holding the killer and history tables.
+        ply:     Distance from the root, used to index the killer table.
+        tt_move: Cached best move for this position, if any. Safe to yield
+                 unverified: it comes from a full-key TT match (or the root
+                 PV of the previous iteration), so it is legal here.
+
+    Yields:
+        Every legal move exactly once, in decreasing expected strength.
+    """
+    # Stage 1: the TT move — the best move the last time this exact
+    # position was searched. It alone refutes most re-visited nodes.
+    if tt_move is not None:
+        yield tt_move
+
+    # Classify the remaining moves in a single pass, scoring captures as
+    # we go. One piece_type_at probe on the destination both detects the
+    # capture and identifies the victim — no separate is_capture() call,
+    # which would re-probe the same square's bitboards. En passant is the
+    # one capture whose destination is empty: the destination equals the
+    # board's ep square and the mover is a pawn (no straight pawn push can
+    # legally land there, since the double-pushed pawn blocks it).
+    ep_square = board.ep_square
+    piece_type_at = board.piece_type_at  # bind once: LOAD_FAST beats LOAD_ATTR in the loop
+
+    # Reuse this ply's scratch lists instead of allocating three fresh lists
+    # per node. Recursion only ever descends (each level uses ply + 1), so no
+    # two active nodes share a ply. An abandoned generator (beta cutoff) may
+    # leave stale entries behind; clearing on entry makes that harmless.
+    if ply <= MAX_DEPTH:
+        captures = state.scratch_captures[ply]
+        captures.clear()
+        capture_scores = state.scratch_scores[ply]
+        capture_scores.clear()
+        quiets = state.scratch_quiets[ply]
+        quiets.clear()
+    else:
+        captures = []
+        capture_scores = []
+        quiets = []
+    for move in moves:
+        if move == tt_move:
+            continue  # Already yielded in stage 1
+        victim = piece_type_at(move.to_square)
+        if victim is not None:
+            capture_scores.append(MVV_LVA[victim][piece_type_at(move.from_square)])
+            captures.append(move)
+        elif move.to_square == ep_square and piece_type_at(move.from_square) == chess.PAWN:
+            capture_scores.append(MVV_LVA[chess.PAWN][chess.PAWN])
+            captures.append(move)
+        else:
+            quiets.append(move)
+
+    # Stage 2: selection-pick the best remaining capture per yield.
+    # Swap-to-end + pop keeps both lists compact without shifting.
+    while captures:
+        best = max(range(len(captures)), key=capture_scores.__getitem__)
+        last = len(captures) - 1
+        captures[best], captures[last] = captures[last], captures[best]
+        capture_scores[best] = capture_scores[last]
+        capture_scores.pop()
+        yield captures.pop()
+
+    # Stage 3: killers first (sibling refutations are likely to work here
+    # too), then the remaining quiet moves by accumulated history credit.
+    killer_primary, killer_secondary = state.killers[ply] if ply <= MAX_DEPTH else (None, None)
+    for killer in (killer_primary, killer_secondary):
+        if killer is not None and killer in quiets:
+            quiets.remove(killer)
+            yield killer
+
+    if len(quiets) > 1:
+        history = state.history
+        quiets.sort(key=lambda m: history[m.from_square * 64 + m.to_square], reverse=True)
+    yield from quiets
+
+
+def _order_captures(board: chess.Board, captures: list[chess.Move]) -> list[chess.Move]:
+    """
+    Order quiescence moves by MVV-LVA, skipping the is-capture test.
+
+    Every move quiescence generates is a capture or a promotion, so the
+    per-move board.is_capture() call in the general scorer is pure
+    overhead here. Non-capturing promotions read an empty destination
+    square and fall back to the pawn-victim row, placing them among the
+    pawn captures — a reasonable rank for a list this short.
 
+    Args:
+        board:    The current board position (used to look up piece types).
+        captures: Legal captures and promotions to order.
 
-def _order_moves(board: chess.Board, moves: Iterable[chess.Move]) -> list[chess.Move]:
+    Returns:
+        List of moves sorted from highest to lowest MVV-LVA score.
     """
-    Order moves for better alpha-beta pruning using MVV-LVA for captures.
+    piece_type_at = board.piece_type_at  # bind once for the sort's key calls
 
-    MVV-LVA (Most Valuable Victim - Least Valuable Aggressor) is a simple but
-    effective heuristic: search captures of high-value pieces first, and prefer
-    to capture with low-value pieces (they're less risky). For example:
-        - PxQ scores highest (cheap attacker, expensive victim)
-        - QxP scores lowest among captures (expensive attacker, cheap victim)
-        - Quiet moves are searched last (score 0)
+    def _capture_score(move: chess.Move) -> int:
+        victim = piece_type_at(move.to_square) or chess.PAWN
+        return MVV_LVA[victim][piece_type_at(move.from_square)]
 
-    This ordering dramatically improves alpha-beta efficiency because captures
-    that win material tend to raise alpha quickly, pruning the remaining siblings.
+    return sorted(captures, key=_capture_score, reverse=True)
 
-    Score formula:
-        captures: 10_000 + victim_value - attacker_value  (always > 0)
-        quiet moves: 0
+
+def _push_move(board: chess.Board, move: chess.Move, state: SearchState) -> None:
+    """
+    Push a move and incrementally update the evaluation terms.
+
+    The move's (mg, eg, phase) delta is computed from the pre-move position
+    — an O(1) operation touching at most four squares — and the updated
+    terms are stacked alongside the board's own move stack. This replaces
+    the O(pieces) from-scratch evaluation at every quiescence leaf.
+
+    Args:
+        board: Position to play the move in. Modified in place (push).
+        move:  The legal move to make.
+        state: Search state carrying the eval terms stack.
+    """
+    mg, eg, phase = state.eval_terms_stack[-1]
+    mg_d, eg_d, phase_d = move_terms_delta(board, move)
+    state.eval_terms_stack.append((mg + mg_d, eg + eg_d, phase + phase_d))
+    board.push(move)
+
+
+def _pop_move(board: chess.Board, state: SearchState) -> None:
+    """
+    Undo the last move and discard its evaluation terms.
 
     Args:
-        board: The current board position (used to look up piece types).
-        moves: Legal moves to order.
+        board: Position to restore. Modified in place (pop).
+        state: Search state carrying the eval terms stack.
+    """
+    board.pop()
+    state.eval_terms_stack.pop()
+
+
+def _has_non_pawn_material(board: chess.Board) -> bool:
+    """
+    Check whether the side to move has any piece besides pawns and the king.
+
+    This is the standard zugzwang guard for null-move pruning. In pawn-only
+    endgames, "doing nothing" is often the *only* good option (zugzwang:
+    every move worsens the position), so the null-move assumption — that
+    making a move is always better than passing — breaks down.
+
+    Args:
+        board: The current position.
 
     Returns:
-        List of moves sorted from highest to lowest score.
+        True if the side to move has at least one knight, bishop, rook,
+        or queen.
     """
-    def _mvv_lva_score(move: chess.Move) -> int:
-        if not board.is_capture(move):
-            return 0
-        attacker = board.piece_at(move.from_square)
-        victim = board.piece_at(move.to_square)
-        attacker_val = PIECE_VALUES.get(attacker.piece_type, 0) if attacker else 0
-        # En passant: the captured pawn is not on move.to_square; default to pawn value.
-        victim_val = PIECE_VALUES.get(victim.piece_type, 0) if victim else PIECE_VALUES[chess.PAWN]
-        return 10_000 + victim_val - attacker_val
+    return bool(
+        (board.knights | board.bishops | board.rooks | board.queens)
+        & board.occupied_co[board.turn]
+    )
 
-    return sorted(moves, key=_mvv_lva_score, reverse=True)
+
+class SearchAborted(Exception):
+    """
+    Raised inside the search tree when the time budget or stop signal fires.
+
+    Unwinding with an exception lets every negamax/quiescence frame abandon
+    its partial work in one step. The alternative — returning a sentinel
+    score and checking it after every recursive call — costs a comparison
+    per node on the hot path and risks a bogus sentinel leaking into the
+    transposition table. get_best_move catches this and falls back to the
+    last fully completed iteration's result.
+    """
+
+
+def _check_abort(state: SearchState) -> None:
+    """
+    Stop the search if the stop event is set or the time budget is spent.
+
+    Called every TIME_CHECK_NODES nodes rather than every node: both the
+    threading.Event poll and the monotonic clock read are function calls
+    into C that cost more than the rest of a node's bookkeeping combined.
+    At typical NPS a 2048-node interval still reacts within a few hundred
+    milliseconds, well inside the 10% time-budget safety margin.
+
+    Args:
+        state: Search state with the stop event and timing fields.
+
+    Raises:
+        SearchAborted: If the search should terminate now.
+    """
+    if state.stop_event.is_set():
+        raise SearchAborted
+    elapsed_ms = (time.monotonic() - state.start_time) * 1000
+    if elapsed_ms >= state.time_limit_ms * TIME_USAGE_FRACTION:
+        # Note: do NOT set the caller's stop event here. The exception alone
+        # carries the abort out of the tree, and the event may be the shared
+        # never-set default — setting it would kill every future search.
+        raise SearchAborted
+
+
+def _record_cutoff(state: SearchState, move: chess.Move, ply: int, depth: int) -> None:
+    """
+    Update the killer and history tables after a quiet-move beta cutoff.
+
+    The move becomes the primary killer at this ply (demoting the previous
+    primary to secondary; at most two killers are kept per ply), and its
+    (from, to) square pair gains depth*depth history credit. Deeper cutoffs
+    earn more credit because they prune exponentially larger subtrees.
+
+    Args:
+        state: Search state holding the killer and history tables.
+        move:  The quiet move that caused the beta cutoff.
+        ply:   Distance from the root where the cutoff occurred.
+        depth: Remaining depth at the cutoff node (history weight = depth^2).
+    """
+    state.history[move.from_square * 64 + move.to_square] += depth * depth
+
+    if ply <= MAX_DEPTH:
+        killers = state.killers[ply]
+        if move != killers[0]:
+            killers[1] = killers[0]  # Demote the previous primary killer
+            killers[0] = move
 
 
 def quiescence(
@@ -144,8 +407,10 @@ def quiescence(
     immediately (the opponent would never allow this position). If it exceeds alpha,
     we raise alpha (we found a quiet move better than any previous option).
 
-    Only captures are searched (not all legal moves). This keeps the tree manageable.
-    Promotions are also captures in most cases; we include any capturing move.
+    Only captures and promotions are searched (not all legal moves). This keeps
+    the tree manageable. Promotions are included even when they don't capture:
+    a quiet e7-e8=Q swings the evaluation by ~800 cp, which is exactly the kind
+    of tactical instability quiescence exists to resolve.
 
     Args:
         board: Current board position. Modified in-place via push/pop.
@@ -157,35 +422,49 @@ def quiescence(
     Returns:
         Score in centipawns from the perspective of the side to move.
     """
-    if state.stop_event.is_set():
-        return 0
-
     state.node_count += 1
 
-    # Time check: quiescence can dominate node counts in tactical positions,
+    # Abort check: quiescence can dominate node counts in tactical positions,
     # so we must check time here too — not only in negamax. Without this check,
     # a shallow depth with few negamax nodes but thousands of quiescence nodes
     # will never trigger the negamax time check and runs completely unconstrained.
-    if state.node_count % TIME_CHECK_NODES == 0:
-        elapsed_ms = (time.monotonic() - state.start_time) * 1000
-        if elapsed_ms >= state.time_limit_ms * TIME_USAGE_FRACTION:
-            state.stop_event.set()
-            return 0
+    # Countdown instead of `node_count % TIME_CHECK_NODES`: a decrement and
+    # compare is cheaper than CPython's big-int modulo on the per-node path.
+    state.nodes_until_check -= 1
+    if state.nodes_until_check <= 0:
+        state.nodes_until_check = TIME_CHECK_NODES
+        _check_abort(state)
 
     # Stand-pat: evaluate the position without making any capture.
     # If the static eval already beats beta, we can prune immediately.
-    stand_pat = evaluate(board)
+    # The (mg, eg, phase) terms are maintained incrementally by
+    # _push_move/_pop_move, so this is an O(1) blend, not a board scan.
+    mg, eg, phase = state.eval_terms_stack[-1]
+    stand_pat = tapered_score(mg, eg, phase, board.turn)
     if stand_pat >= beta:
         return beta
     if stand_pat > alpha:
         alpha = stand_pat
 
-    # Search captures only (ordered by MVV-LVA to find good captures first).
-    captures = [m for m in board.legal_moves if board.is_capture(m)]
-    for move in _order_moves(board, captures):
-        board.push(move)
+    # Generate captures directly instead of filtering the full legal-move
+    # list: generate_legal_captures() masks generation to enemy-occupied
+    # squares (plus en passant), so quiet moves are never generated or
+    # legality-checked at all. Non-capturing promotions — the other
+    # eval-swinging move type quiescence must see — are produced separately
+    # by restricting back-rank pawns to empty destination squares.
+    captures = list(board.generate_legal_captures())
+    promotion_pawns = (
+        board.pawns
+        & board.occupied_co[board.turn]
+        & (chess.BB_RANK_7 if board.turn == chess.WHITE else chess.BB_RANK_2)
+    )
+    if promotion_pawns:
+        captures.extend(board.generate_legal_moves(promotion_pawns, ~board.occupied))
+
+    for move in _order_captures(board, captures):
+        _push_move(board, move, state)
         score = -quiescence(board, -beta, -alpha, ply + 1, state)
-        board.pop()
+        _pop_move(board, state)
 
         if score >= beta:
             return beta
@@ -233,7 +512,11 @@ def negamax(
     Returns:
         The evaluation score in centipawns from the perspective of the side
         to move at this node. Positive means the side to move is winning.
-        Returns 0 immediately if stop_event is set (result is discarded).
+
+    Raises:
+        SearchAborted: When the stop event fires or the time budget runs
+        out (checked every TIME_CHECK_NODES nodes). get_best_move catches
+        this and keeps the previous iteration's result.
 
     Chess programming context:
         Alpha-beta pruning reduces the search tree from O(b^d) to approximately
@@ -246,47 +529,139 @@ def negamax(
         99998) from "mate in 3" (score 99996) and always plays the fastest
         available checkmate.
     """
-    # Abort immediately if the search has been cancelled.
-    if state.stop_event.is_set():
-        return 0
-
     state.node_count += 1
 
-    # Periodic time check: avoid the overhead of checking every node.
-    # Every TIME_CHECK_NODES nodes, measure elapsed time and stop if over budget.
-    if state.node_count % TIME_CHECK_NODES == 0:
-        elapsed_ms = (time.monotonic() - state.start_time) * 1000
-        if elapsed_ms >= state.time_limit_ms * TIME_USAGE_FRACTION:
-            state.stop_event.set()
+    # Periodic abort check: polling the stop event and the clock on every
+    # node costs two C calls per node; every TIME_CHECK_NODES nodes is
+    # responsive enough (see _check_abort). The countdown avoids a big-int
+    # modulo per node — decrement and compare are the cheapest ops CPython has.
+    state.nodes_until_check -= 1
+    if state.nodes_until_check <= 0:
+        state.nodes_until_check = TIME_CHECK_NODES
+        _check_abort(state)
+
+    # Draw screens BEFORE the transposition table probe. TT entries are
+    # path-independent: the same position reached by a fresh line and by a
+    # repetition on the current search path shares one entry, so probing
+    # first would return a cached non-draw score and let the engine shuffle
+    # a won position into a threefold. Never at the root (ply > 0 guards):
+    # returning before the move loop would leave state.best_move unset and
+    # the engine with no move to play in a claimable-but-playable position.
+    if ply > 0:
+        # 50-move rule: 100 halfmoves without a capture or pawn move.
+        if board.halfmove_clock >= 100:
+            return 0
+        # Repetition: is_repetition scans the move history (O(history) with
+        # a board rewind), so only run it when several reversible moves in a
+        # row make a repetition possible at all. Twofold is treated as a
+        # draw inside the tree — if repeating once is our best option, the
+        # full threefold is only a move-pair away.
+        if board.halfmove_clock >= 4 and board.is_repetition(2):
+            return 0
+        # Insufficient material (e.g. bare kings, K+B vs K): every such
+        # position has at most 4 pieces, so a single popcount gates the
+        # more detailed check.
+        if board.occupied.bit_count() <= 4 and board.is_insufficient_material():
             return 0
 
-    # Terminal node: game already decided (checkmate, stalemate, draw by rule).
-    # board.is_game_over() handles: checkmate, stalemate, insufficient material,
-    # 50-move rule, and threefold repetition. All non-checkmate endings are draws.
-    if board.is_game_over():
-        if board.is_checkmate():
+    # Transposition table probe. If this exact position was already searched
+    # to at least the remaining depth, reuse the cached result: return it
+    # outright (EXACT), or tighten the alpha-beta window (bound entries).
+    # Even on a depth miss, the cached best move massively improves move
+    # ordering. The root (ply 0) never returns early — it must run the move
+    # loop so state.best_move gets set.
+    key = board._transposition_key()
+    tt_move: chess.Move | None = None
+    entry = transposition_table.probe(key)
+    if entry is not None:
+        _, entry_depth, entry_score, entry_flag, tt_move = entry
+        if entry_depth >= depth and ply > 0:
+            # Cached mate scores are stored relative to the entry's node;
+            # re-base them to be relative to the root (see the store below).
+            if entry_score > MATE_SCORE_THRESHOLD:
+                entry_score -= ply
+            elif entry_score < -MATE_SCORE_THRESHOLD:
+                entry_score += ply
+            if entry_flag == EXACT:
+                return entry_score
+            if entry_flag == LOWERBOUND and entry_score > alpha:
+                alpha = entry_score
+            elif entry_flag == UPPERBOUND and entry_score < beta:
+                beta = entry_score
+            if alpha >= beta:
+                return entry_score
+
+    # At the root, fall back to the previous iteration's best move if the
+    # TT slot was evicted: the PV move from depth d-1 is by far the best
+    # first guess at depth d (this is what makes iterative deepening
+    # cheaper than a direct full-depth search, not more expensive).
+    if ply == 0 and tt_move is None:
+        tt_move = state.best_move
+
+    # Remember the window lower edge so we can classify the final score as
+    # EXACT / UPPERBOUND / LOWERBOUND when storing it in the table.
+    alpha_original = alpha
+
+    # Terminal-node detection without board.is_game_over(). is_game_over()
+    # re-checks threefold repetition and the 50-move rule on every node —
+    # both are O(history) walks that dominated profile time. The draw rules
+    # were already screened above; here we materialize the legal move list
+    # once (it doubles as the move loop below) and derive checkmate/
+    # stalemate from it directly. generate_legal_moves() is called
+    # directly — the board.legal_moves property would wrap the same
+    # generator in a LegalMoveGenerator object we'd immediately discard.
+    legal_moves = list(board.generate_legal_moves())
+    if not legal_moves:
+        if board.is_check():
             # The side to move is IN checkmate, so it loses.
             # Encode distance: prefer being mated later over being mated sooner.
             return -(CHECKMATE_SCORE - ply)
-        return 0  # Stalemate or draw
+        return 0  # Stalemate
 
     # Leaf node: drop into quiescence search to resolve captures.
     # This eliminates the horizon effect — we don't stop mid-exchange.
-    if depth == 0:
+    # (<= rather than ==: null-move pruning below can reduce depth past 0.)
+    if depth <= 0:
         return quiescence(board, alpha, beta, ply, state)
 
+    # Null-move pruning: give the opponent a free move. If our position is
+    # still good enough to beat beta even after passing, the real search
+    # (where we DO move) would certainly beat beta too — prune the node.
+    # Skipped when in check (passing would be illegal), when the side to
+    # move has only pawns (zugzwang guard — see _has_non_pawn_material),
+    # at low depths (the reduced search would drop straight into
+    # quiescence), and at the root (the root must produce a best move).
+    if (
+        depth >= 3
+        and ply > 0
+        and not board.is_check()
+        and _has_non_pawn_material(board)
+    ):
+        # A null move changes no pieces, so the eval terms carry over as-is.
+        board.push(chess.Move.null())
+        state.eval_terms_stack.append(state.eval_terms_stack[-1])
+        # Null-window search around beta: we only care whether the score
+        # beats beta, not its exact value, so the cheapest window suffices.
+        null_score = -negamax(
+            board, depth - 1 - NULL_MOVE_REDUCTION, -beta, -beta + 1, ply + 1, state
+        )
+        _pop_move(board, state)
+        if null_score >= beta:
+            return null_score
+
     best_score = -CHECKMATE_SCORE
     best_move = None
 
-    # MVV-LVA move ordering: search captures first (ordered by victim/attacker value),
-    # then quiet moves. Better ordering → more alpha-beta cutoffs → fewer nodes.
-    for move in _order_moves(board, board.legal_moves):
-        board.push(move)
+    # Move ordering: TT best move first, then captures (MVV-LVA), then
+    # killers and history-rated quiet moves. _staged_moves orders lazily,
+    # so a first-move cutoff never pays for sorting the rest.
+    for move in _staged_moves(board, legal_moves, state, ply, tt_move):
+        _push_move(board, move, state)
         # Swap and negate the window for the child (negamax convention).
         # From the child's perspective: their beta is our alpha (negated),
         # and their alpha is our beta (negated).
         score = -negamax(board, depth - 1, -beta, -alpha, ply + 1, state)
-        board.pop()
+        _pop_move(board, state)
 
         if score > best_score:
             best_score = score
@@ -298,10 +673,33 @@ def negamax(
 
         # Beta cutoff: the opponent has a refutation — they would never allow
         # this line because we already have a score better than what they'd
-        # permit. No need to search remaining sibling moves.
+        # permit. No need to search remaining sibling moves. Quiet moves that
+        # cut here are remembered (killer/history) to be tried earlier in
+        # sibling nodes.
         if alpha >= beta:
+            if not board.is_capture(move):
+                _record_cutoff(state, move, ply, depth)
             break
 
+    # Store the result for future transpositions. An aborted search never
+    # reaches this point (SearchAborted unwinds past it), so partial
+    # results cannot pollute the table.
+    if best_score <= alpha_original:
+        flag = UPPERBOUND   # Never raised alpha: true score is at most this
+    elif best_score >= beta:
+        flag = LOWERBOUND   # Beta cutoff: true score is at least this
+    else:
+        flag = EXACT
+    # Mate scores are root-relative (CHECKMATE_SCORE - ply); convert to
+    # node-relative before caching so a hit at a different ply stays
+    # correct. The probe above applies the reverse adjustment.
+    store_score = best_score
+    if store_score > MATE_SCORE_THRESHOLD:
+        store_score += ply
+    elif store_score < -MATE_SCORE_THRESHOLD:
+        store_score -= ply
+    transposition_table.store(key, depth, store_score, flag, best_move)
+
     # At the root, save the best move for the caller to retrieve.
     if ply == 0:
         state.best_move = best_move
@@ -310,10 +708,16 @@ def negamax(
     return best_score
 
 
+# Default stop event for callers that never interrupt a search externally
+# (the web app relies purely on the time budget). Sharing one never-set
+# Event saves allocating an Event + Condition + RLock per call.
+_NEVER_STOP = threading.Event()
+
+
 def get_best_move(
     board: chess.Board,
     time_limit_ms: int,
-    stop_event: threading.Event,
+    stop_event: threading.Event | None = None,
 ) -> tuple[chess.Move | None, int, int, int]:
     """
     Return the best move for the current position within the time budget.
@@ -341,13 +745,19 @@ def get_best_move(
         board:         The current position. Not modified.
         time_limit_ms: Time budget in milliseconds.
         stop_event:    Threading event. When set, returns immediately with
-                       the best move found so far.
+                       the best move found so far. Pass None when no caller
+                       will ever interrupt the search (time budget only).
 
     Returns:
         Tuple of (move, score_cp, depth, nodes).
     """
+    if stop_event is None:
+        stop_event = _NEVER_STOP
+
     # Early exit: if the game is already over, there are no legal moves.
-    if not any(board.legal_moves) or stop_event.is_set():
+    # LegalMoveGenerator.__bool__ short-circuits after finding one legal
+    # move, so this is cheaper than draining the generator through any().
+    if not board.legal_moves or stop_event.is_set():
         return (None, 0, 0, 0)
 
     state = SearchState(
@@ -355,8 +765,12 @@ def get_best_move(
         time_limit_ms=float(time_limit_ms),
         start_time=time.monotonic(),
     )
+    # Seed the incremental evaluation terms from the root position; every
+    # push/pop during the search updates them in O(1) from here on.
+    state.eval_terms_stack.append(eval_terms(board))
 
     completed_depth = 0
+    root_ply = len(board.move_stack)
 
     for depth in range(1, MAX_DEPTH + 1):
         # Don't start a new iteration if we've already used most of the time budget.
@@ -369,10 +783,44 @@ def get_best_move(
         prev_best_move = state.best_move
         prev_best_score = state.best_score
 
-        negamax(board, depth, -CHECKMATE_SCORE, CHECKMATE_SCORE, 0, state)
-
-        if state.stop_event.is_set():
-            # This iteration was interrupted — restore the last complete result.
+        # Fresh abort-check countdown for the new iteration (see _check_abort).
+        state.nodes_until_check = TIME_CHECK_NODES
+
+        try:
+            if completed_depth == 0 or abs(prev_best_score) > MATE_SCORE_THRESHOLD:
+                # Full-width search at depth 1 (no previous score to aspire
+                # around) and once a mate is on the board: mate scores jump
+                # by whole plies between depths, so a narrow centipawn
+                # window around them would fail on every iteration.
+                negamax(board, depth, -CHECKMATE_SCORE, CHECKMATE_SCORE, 0, state)
+            else:
+                # Aspiration window: assume this depth's score lands near the
+                # previous depth's. The narrow window prunes far more; if the
+                # true score falls outside it (fail low/high), the result is
+                # just a bound — re-search with only the failed side opened,
+                # keeping the other bound tight.
+                aspiration_alpha = prev_best_score - ASPIRATION_WINDOW
+                aspiration_beta = prev_best_score + ASPIRATION_WINDOW
+                negamax(board, depth, aspiration_alpha, aspiration_beta, 0, state)
+                if state.best_score >= aspiration_beta:
+                    # Fail high: the position is better than expected.
+                    negamax(board, depth, aspiration_alpha, CHECKMATE_SCORE, 0, state)
+                    # Rarely the re-search swings past the kept bound too
+                    # (score dropped below alpha): fall back to full width.
+                    if state.best_score <= aspiration_alpha:
+                        negamax(board, depth, -CHECKMATE_SCORE, CHECKMATE_SCORE, 0, state)
+                elif state.best_score <= aspiration_alpha:
+                    # Fail low: the position is worse than expected.
+                    negamax(board, depth, -CHECKMATE_SCORE, aspiration_beta, 0, state)
+                    if state.best_score >= aspiration_beta:
+                        negamax(board, depth, -CHECKMATE_SCORE, CHECKMATE_SCORE, 0, state)
+        except SearchAborted:
+            # The abort unwound past the in-tree board.pop() calls, so the
+            # board still has the aborted line pushed — rewind it to the
+            # root, and fall back to the last complete iteration's result.
+            while len(board.move_stack) > root_ply:
+                board.pop()
+            del state.eval_terms_stack[1:]
             if prev_best_move is not None:
                 state.best_move = prev_best_move
                 state.best_score = prev_best_score
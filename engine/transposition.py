@@ -0,0 +1,114 @@
+"""
+Transposition table: caching search results keyed by position hash.
+
+Chess positions transpose: the same position is frequently reached through
+several different move orders (1.d4 d5 2.c4 and 1.c4 d5 2.d4 are the same
+position). Without a cache, negamax re-searches the identical subtree every
+time it is reached. The transposition table (TT) stores the result of each
+searched position so later arrivals can reuse it — either returning the
+cached score outright, tightening the alpha-beta window, or at minimum
+trying the cached best move first (a huge move-ordering win).
+
+Keys come from python-chess's Board._transposition_key(), which the board
+maintains incrementally as moves are pushed and popped. It is a tuple of
+the piece bitboards plus turn, castling rights, and en-passant square —
+exactly the fields that define position identity for transposition
+purposes. We hash that tuple to pick a slot and store the full tuple in
+the entry to rule out index collisions.
+
+Score bounds:
+    Alpha-beta does not always compute exact scores. A beta cutoff only
+    proves "at least this good" (LOWERBOUND); failing to raise alpha only
+    proves "at most this good" (UPPERBOUND). Each entry records which kind
+    of score it holds so the prober knows how it may be used.
+"""
+
+import chess
+
+from engine.constants import TT_SIZE
+
+# Entry score types. EXACT scores can be returned directly; bound scores
+# can only tighten one side of the alpha-beta window.
+EXACT: int = 0       # Score is the true minimax value of the position
+LOWERBOUND: int = 1  # Score is a lower bound (the search failed high / beta cutoff)
+UPPERBOUND: int = 2  # Score is an upper bound (the search failed low / below alpha)
+
+# A TT entry: (key, depth, score, flag, best_move).
+TTEntry = tuple[object, int, int, int, chess.Move | None]
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table with depth-preferred replacement.
+
+    The table is a flat list of TT_SIZE slots indexed by the position hash
+    masked to the table size (TT_SIZE is a power of two, so masking is a
+    single AND). Each slot holds one entry; on an index collision the
+    deeper of the two searches wins, because deeper results are more
+    expensive to recompute and prune larger subtrees when reused.
+
+    Memory: one tuple per occupied slot, roughly 100 bytes each in CPython.
+    A full table of 2^20 entries is on the order of 100 MB worst case; in
+    practice a single game fills only a fraction of the slots.
+    """
+
+    def __init__(self, size: int = TT_SIZE) -> None:
+        """
+        Create an empty table with the given number of slots.
+
+        Args:
+            size: Number of slots. Must be a power of two so that indexing
+                  can use a bitmask instead of the slower modulo operator.
+        """
+        assert size & (size - 1) == 0, "TT size must be a power of two"
+        self._mask: int = size - 1
+        self._slots: list[TTEntry | None] = [None] * size
+
+    def probe(self, key: object) -> TTEntry | None:
+        """
+        Look up the entry for a position key.
+
+        Args:
+            key: The position key (Board._transposition_key() tuple).
+
+        Returns:
+            The stored (key, depth, score, flag, best_move) entry, or None
+            if the slot is empty or occupied by a different position.
+        """
+        entry = self._slots[hash(key) & self._mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(
+        self,
+        key: object,
+        depth: int,
+        score: int,
+        flag: int,
+        best_move: chess.Move | None,
+    ) -> None:
+        """
+        Store a search result, keeping the deeper entry on collision.
+
+        Args:
+            key:       The position key (Board._transposition_key() tuple).
+            depth:     Remaining search depth the score was computed at.
+            score:     Centipawn score from the side-to-move's perspective.
+                       Mate scores must be ply-adjusted by the caller (see
+                       engine/search.py) so they are relative to this node.
+            flag:      EXACT, LOWERBOUND, or UPPERBOUND.
+            best_move: The best move found, used for move ordering on later
+                       probes. May be None for fail-low nodes.
+        """
+        idx = hash(key) & self._mask
+        existing = self._slots[idx]
+        # Depth-preferred replacement: a shallower search never evicts a
+        # deeper one. Same-position entries are always refreshed.
+        if existing is None or existing[0] == key or depth >= existing[1]:
+            self._slots[idx] = (key, depth, score, flag, best_move)
+
+    def clear(self) -> None:
+        """Empty the table (called on ucinewgame so games don't share state)."""
+        for i in range(len(self._slots)):
+            self._slots[i] = None
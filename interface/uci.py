@@ -22,6 +22,7 @@ Debug output must go to stderr or be suppressed entirely.
 
 import sys
 import os
+import selectors
 import threading
 import time
 
@@ -37,21 +38,39 @@ if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
 import chess
-from engine.search import SearchState, get_best_move
+from engine.search import SearchState, get_best_move, transposition_table
+
+
+# Raw buffered stdout. Writing pre-encoded bytes here skips print()'s
+# formatting machinery, and flushing selectively batches the write()
+# syscalls: a burst of info lines costs one syscall instead of one each.
+_OUT = sys.stdout.buffer
+
+# Lines the GUI blocks on must reach it immediately. Everything else
+# ("info" spam) may sit in the buffer until the next critical line —
+# a bestmove always follows, so nothing is ever stranded for long.
+_FLUSH_PREFIXES = ("bestmove", "readyok", "uciok")
 
 
 def _send(line: str) -> None:
     """
-    Write a line to stdout and flush immediately.
+    Write a line to stdout, flushing when the GUI is waiting on it.
 
-    UCI requires every output line to be flushed right away. GUIs read
-    line-by-line; if the buffer is not flushed, the GUI will hang waiting
-    for output that is already in the buffer.
+    GUIs read line-by-line and block on protocol-critical responses
+    (bestmove, readyok, uciok) — those flush immediately. Informational
+    lines are buffered and ride along with the next flush, batching
+    syscalls when the search streams per-depth info.
+
+    The line plus newline goes out as a single write() call, which the
+    buffered writer serializes internally — safe even though both the
+    main thread and the search thread send lines.
 
     Args:
         line: The UCI response line to send (without trailing newline).
     """
-    print(line, flush=True)
+    _OUT.write(line.encode() + b"\n")
+    if line.startswith(_FLUSH_PREFIXES):
+        _OUT.flush()
 
 
 def _log(message: str) -> None:
@@ -86,6 +105,10 @@ class UciHandler:
         self.board: chess.Board = chess.Board()
         self.search_thread: threading.Thread | None = None
         self.stop_event: threading.Event = threading.Event()
+        # Set by the search thread on exit (in a finally block), so
+        # _stop_search can wait on it with a short timeout instead of
+        # going straight to a thread join.
+        self.search_done: threading.Event = threading.Event()
 
     # -----------------------------------------------------------------------
     # Command handlers
@@ -120,11 +143,12 @@ class UciHandler:
         Respond to the "ucinewgame" command.
 
         Signals that a new game is starting. We stop any running search,
-        reset the board to the starting position, and clear any game-specific
-        state (transposition table, killer moves, etc. — none in v1).
+        reset the board to the starting position, and clear game-specific
+        state: the transposition table must not leak results between games.
         """
         self._stop_search()
         self.board = chess.Board()
+        transposition_table.clear()
 
     def handle_position(self, tokens: list[str]) -> None:
         """
@@ -145,6 +169,10 @@ class UciHandler:
             tokens: The command tokens with "position" already stripped.
                     tokens[0] is "startpos" or "fen".
         """
+        # The search thread works on self.board directly (no copy), so any
+        # still-running search must finish before the board is replaced.
+        self._stop_search()
+
         try:
             if not tokens:
                 return
@@ -167,13 +195,14 @@ class UciHandler:
                 return
 
             # Replay the move list to reach the current position.
-            # python-chess handles castling rights, en passant, and repetition
-            # detection automatically as moves are pushed.
+            # push_uci parses and legality-checks in one call; the previous
+            # `move in self.board.legal_moves` membership test linearly
+            # scanned the regenerated legal-move list per move, making a
+            # long game's setup quadratic in its length.
             for uci_move in move_tokens:
-                move = chess.Move.from_uci(uci_move)
-                if move in self.board.legal_moves:
-                    self.board.push(move)
-                else:
+                try:
+                    self.board.push_uci(uci_move)
+                except ValueError:
                     _log(f"uci: illegal move in position command: {uci_move}")
                     break
 
@@ -190,9 +219,16 @@ class UciHandler:
             - movetime <ms>: think for exactly this many milliseconds
             - wtime/btime [winc/binc]: think based on remaining clock time
 
-        After parsing the time budget, we copy the current board state and
-        launch a daemon thread to run the search. The main thread continues
-        reading stdin so it can handle "stop" immediately.
+        After parsing the time budget, we hand the LIVE board (not a copy)
+        to a daemon search thread. get_best_move strictly balances push/pop
+        and rewinds to the root on abort, so the board returns in its
+        pre-search state, and keeping the real move stack lets in-search
+        repetition detection see the game history. This is safe because
+        searches are serialized: every path that mutates self.board —
+        including handle_position and this handler — calls _stop_search()
+        first, so the old search thread is finished before the board is
+        touched. The main thread keeps reading stdin so it can handle
+        "stop" immediately.
 
         Args:
             tokens: The command tokens with "go" already stripped.
@@ -203,13 +239,19 @@ class UciHandler:
         # Parse the time control parameters
         time_limit_ms = self._parse_go_time(tokens)
 
-        # Reset the stop event for the new search
+        # Reset the stop/done events for the new search
         self.stop_event = threading.Event()
-
-        # Copy the board so the search thread has its own state.
-        # The main thread may receive the next "position" command while the
-        # search is still running; copying prevents a data race.
-        board_copy = self.board.copy()
+        self.search_done = threading.Event()
+        search_done = self.search_done
+
+        # Hand the search thread the live board rather than a copy.
+        # get_best_move strictly balances push/pop (and rewinds to the root
+        # on abort), so the board comes back in its pre-search state, and
+        # keeping the real move stack preserves in-search repetition
+        # detection against the game history. This is safe because searches
+        # are serialized: every mutation of self.board — handle_position
+        # included — calls _stop_search() first.
+        search_board = self.board
 
         # Capture references for the closure
         stop_event = self.stop_event
@@ -226,16 +268,20 @@ class UciHandler:
             """
             try:
                 start = time.monotonic()
-                move, score, depth, nodes = get_best_move(board_copy, time_ms, stop_event)
+                move, score, depth, nodes = get_best_move(search_board, time_ms, stop_event)
                 elapsed_ms = max(1, int((time.monotonic() - start) * 1000))
 
                 if move is not None:
                     nps = max(1, nodes * 1000 // elapsed_ms)
-                    _send(
-                        f"info depth {depth} score cp {score} "
-                        f"nodes {nodes} nps {nps} time {elapsed_ms}"
+                    # Bytes %-formatting writes the line in one step — no
+                    # f-string assembly and no str.encode per emission.
+                    # One flush pushes both lines out in a single syscall.
+                    _OUT.write(
+                        b"info depth %d score cp %d nodes %d nps %d time %d\n"
+                        % (depth, score, nodes, nps, elapsed_ms)
                     )
-                    _send(f"bestmove {move.uci()}")
+                    _OUT.write(b"bestmove %s\n" % move.uci().encode())
+                    _OUT.flush()
                 else:
                     # No legal moves: the game is over (checkmate or stalemate).
                     # UCI requires a bestmove response; "(none)" is the standard.
@@ -245,6 +291,11 @@ class UciHandler:
                 _log(f"search error: {e}")
                 _send("bestmove (none)")
 
+            finally:
+                # Completion handshake for _stop_search — set unconditionally
+                # so an exception can never leave the main thread waiting.
+                search_done.set()
+
         self.search_thread = threading.Thread(target=search_and_reply, daemon=True)
         self.search_thread.start()
 
@@ -275,14 +326,17 @@ class UciHandler:
         """
         Signal the current search thread to stop and wait for it to exit.
 
-        Sets the stop_event so the search function returns at its next
-        check point, then joins the thread with a 2-second timeout. The
-        timeout prevents the UCI loop from hanging if the search thread
-        misbehaves, but in normal operation the thread exits well within 2s.
+        Sets the stop_event, then waits on the search_done handshake with a
+        short timeout — the search aborts within a few thousand nodes, so
+        this normally returns in single-digit milliseconds. Only if the
+        handshake times out (search thread wedged in a long python-chess
+        call) do we fall back to a hard join: the search works on the live
+        board, so proceeding before it exits would corrupt the position.
         """
         self.stop_event.set()
         if self.search_thread is not None and self.search_thread.is_alive():
-            self.search_thread.join(timeout=2.0)
+            if not self.search_done.wait(timeout=0.1):
+                self.search_thread.join(timeout=2.0)
         self.search_thread = None
 
     def _parse_go_time(self, tokens: list[str]) -> int:
@@ -303,31 +357,40 @@ class UciHandler:
         Returns:
             Time budget in milliseconds.
         """
-        params: dict[str, int] = {}
-        i = 0
-        while i < len(tokens) - 1:
-            key = tokens[i]
+        # One pass over the tokens into plain locals — no dict to build,
+        # hash into and throw away on every go command. Malformed values
+        # are skipped, matching the old behaviour.
+        movetime = wtime = btime = winc = binc = None
+        it = iter(tokens)
+        for tok in it:
             try:
-                params[key] = int(tokens[i + 1])
-                i += 2
-            except (ValueError, IndexError):
-                i += 1
+                if tok == "movetime":
+                    movetime = int(next(it, "0"))
+                elif tok == "wtime":
+                    wtime = int(next(it, "0"))
+                elif tok == "btime":
+                    btime = int(next(it, "0"))
+                elif tok == "winc":
+                    winc = int(next(it, "0"))
+                elif tok == "binc":
+                    binc = int(next(it, "0"))
+            except ValueError:
+                continue
 
         # movetime: use exactly the specified duration
-        if "movetime" in params:
-            return params["movetime"]
+        if movetime is not None:
+            return movetime
 
         # wtime/btime: allocate based on which colour we are playing
-        color = self.board.turn  # chess.WHITE or chess.BLACK
-        time_key = "wtime" if color == chess.WHITE else "btime"
-        inc_key = "winc" if color == chess.WHITE else "binc"
+        if self.board.turn == chess.WHITE:
+            time_left, increment = wtime, winc
+        else:
+            time_left, increment = btime, binc
 
-        if time_key in params:
-            time_left = params[time_key]
-            increment = params.get(inc_key, 0)
+        if time_left is not None:
             # Standard formula: allocate 1/40 of remaining time plus increment.
             # This keeps enough time in reserve for the rest of the game.
-            return max(1, time_left // 40 + increment)
+            return max(1, time_left // 40 + (increment or 0))
 
         # "go infinite" or unrecognised parameters: search until stopped
         return 10_000_000  # ~2.8 hours — effectively infinite
@@ -337,8 +400,17 @@ def run_uci_loop() -> None:
     """
     Main UCI protocol loop.
 
-    Reads lines from stdin and dispatches each command to the UciHandler.
-    Runs until the "quit" command is received or stdin is closed.
+    Reads stdin in raw chunks and dispatches each complete line to the
+    UciHandler. Runs until the "quit" command is received or stdin is closed.
+
+    Why raw os.read instead of `for line in sys.stdin`:
+        The text-mode iterator sits behind Python's line buffering, and
+        while the search thread holds the GIL the main thread can lag an
+        extra buffered-fill behind a "stop" the GUI already sent. Waiting
+        on a selector and pulling whatever bytes are ready keeps
+        stop-to-bestmove latency down to the scheduler quantum. Partial
+        lines are carried over between reads; GUIs routinely send several
+        commands in one write, so one chunk may hold many lines.
 
     Error handling:
         Each command is wrapped in a try/except so that a bug in one
@@ -348,8 +420,24 @@ def run_uci_loop() -> None:
     """
     handler = UciHandler()
 
-    for raw_line in sys.stdin:
-        line = raw_line.strip()
+    selector = selectors.DefaultSelector()
+    selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+    pending = b""
+
+    lines: list[str] = []
+    while True:
+        if not lines:
+            selector.select()
+            chunk = os.read(sys.stdin.fileno(), 4096)
+            if not chunk:
+                break  # EOF: the GUI closed our stdin
+            pending += chunk
+            head, sep, pending = pending.rpartition(b"\n")
+            if not sep:
+                continue  # No complete line yet; keep accumulating
+            lines = head.decode(errors="replace").split("\n")
+
+        line = lines.pop(0).strip()
         if not line:
             continue
 
@@ -27,11 +27,21 @@ import chess
 
 
 def get_best_move(board: chess.Board, time_limit_ms: int, stop_event: threading.Event):
-    """Return a uniformly random legal move."""
-    legal_moves = list(board.legal_moves)
-    if not legal_moves or stop_event.is_set():
+    """Return a uniformly random legal move.
+
+    Uses reservoir sampling over the legal-move generator: each move i is
+    chosen with probability 1/(i+1), which works out to a uniform pick in a
+    single pass without materializing the move list.
+    """
+    if stop_event.is_set():
+        return (None, 0, 0)
+    picked = None
+    for i, move in enumerate(board.legal_moves):
+        if random.randrange(i + 1) == 0:
+            picked = move
+    if picked is None:  # No legal moves: checkmate or stalemate
         return (None, 0, 0)
-    return (random.choice(legal_moves), 0, 1)
+    return (picked, 0, 1)
 
 
 # ---------------------------------------------------------------------------
@@ -39,8 +49,16 @@ def get_best_move(board: chess.Board, time_limit_ms: int, stop_event: threading.
 # ---------------------------------------------------------------------------
 
 
+# Buffered stdout: flush only on lines the GUI blocks on; info lines
+# ride along with the next flush (one syscall per burst, not per line).
+_OUT = sys.stdout.buffer
+_FLUSH_PREFIXES = ("bestmove", "readyok", "uciok")
+
+
 def _send(line: str) -> None:
-    print(line, flush=True)
+    _OUT.write(line.encode() + b"\n")
+    if line.startswith(_FLUSH_PREFIXES):
+        _OUT.flush()
 
 
 def _log(msg: str) -> None:
@@ -48,20 +66,28 @@ def _log(msg: str) -> None:
 
 
 def _parse_go_time(tokens: list[str], turn: bool) -> int:
-    params: dict[str, int] = {}
-    i = 0
-    while i < len(tokens) - 1:
+    movetime = wtime = btime = winc = binc = None
+    it = iter(tokens)
+    for tok in it:
         try:
-            params[tokens[i]] = int(tokens[i + 1])
-            i += 2
-        except (ValueError, IndexError):
-            i += 1
-    if "movetime" in params:
-        return params["movetime"]
-    time_key = "wtime" if turn == chess.WHITE else "btime"
-    inc_key = "winc" if turn == chess.WHITE else "binc"
-    if time_key in params:
-        return max(1, params[time_key] // 40 + params.get(inc_key, 0))
+            if tok == "movetime":
+                movetime = int(next(it, "0"))
+            elif tok == "wtime":
+                wtime = int(next(it, "0"))
+            elif tok == "btime":
+                btime = int(next(it, "0"))
+            elif tok == "winc":
+                winc = int(next(it, "0"))
+            elif tok == "binc":
+                binc = int(next(it, "0"))
+        except ValueError:
+            continue
+    if movetime is not None:
+        return movetime
+    time_left = wtime if turn == chess.WHITE else btime
+    increment = winc if turn == chess.WHITE else binc
+    if time_left is not None:
+        return max(1, time_left // 40 + (increment or 0))
     return 10_000_000
 
 
@@ -111,9 +137,11 @@ def run_uci_loop() -> None:
                 else:
                     continue
                 for uci_move in move_tokens:
-                    m = chess.Move.from_uci(uci_move)
-                    if m in board.legal_moves:
-                        board.push(m)
+                    try:
+                        board.push_uci(uci_move)
+                    except ValueError:
+                        _log(f"illegal move in position command: {uci_move}")
+                        break
 
             elif cmd == "go":
                 stop_event.set()
@@ -131,8 +159,12 @@ def run_uci_loop() -> None:
                         elapsed = max(1, int((time.monotonic() - t0) * 1000))
                         if move is not None:
                             nps = max(1, 1000 // elapsed)
-                            _send(f"info depth {depth} score cp {score} nodes 1 nps {nps} time {elapsed}")
-                            _send(f"bestmove {move.uci()}")
+                            _OUT.write(
+                                b"info depth %d score cp %d nodes 1 nps %d time %d\n"
+                                % (depth, score, nps, elapsed)
+                            )
+                            _OUT.write(b"bestmove %s\n" % move.uci().encode())
+                            _OUT.flush()
                         else:
                             _send("bestmove (none)")
                     except Exception as e:
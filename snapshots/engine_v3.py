@@ -45,12 +45,29 @@ CHECKMATE_SCORE: int = 99_999
 
 
 def evaluate(board: chess.Board) -> int:
-    """Material count from side-to-move perspective (centipawns)."""
-    white = sum(
-        len(board.pieces(pt, chess.WHITE)) * v for pt, v in PIECE_VALUES.items()
+    """
+    Material count from side-to-move perspective (centipawns).
+
+    Counted straight off the piece bitboards with int.bit_count() — a single
+    popcount per piece type — instead of board.pieces(), which allocates a
+    SquareSet object per (piece, color) pair at every leaf.
+    """
+    white_occ, black_occ = board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK]
+    pawns, knights, bishops = board.pawns, board.knights, board.bishops
+    rooks, queens = board.rooks, board.queens
+    white = (
+        (pawns & white_occ).bit_count() * 100
+        + (knights & white_occ).bit_count() * 320
+        + (bishops & white_occ).bit_count() * 330
+        + (rooks & white_occ).bit_count() * 500
+        + (queens & white_occ).bit_count() * 900
     )
-    black = sum(
-        len(board.pieces(pt, chess.BLACK)) * v for pt, v in PIECE_VALUES.items()
+    black = (
+        (pawns & black_occ).bit_count() * 100
+        + (knights & black_occ).bit_count() * 320
+        + (bishops & black_occ).bit_count() * 330
+        + (rooks & black_occ).bit_count() * 500
+        + (queens & black_occ).bit_count() * 900
     )
     score = white - black
     return score if board.turn == chess.WHITE else -score
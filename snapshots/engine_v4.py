@@ -15,8 +15,10 @@ Strength improvements over v3 (~768 ELO):
 Used as the baseline for Step 5 SPRT benchmarks.
 """
 
+import array
 import sys
 import os
+import selectors
 import threading
 import time
 from typing import Iterable
@@ -26,6 +28,7 @@ if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
 import chess
+import chess.polyglot
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -49,9 +52,26 @@ PIECE_VALUES: dict[int, int] = {
 
 CHECKMATE_SCORE: int = 99_999
 MAX_DEPTH: int = 64
-TIME_CHECK_NODES: int = 2_048
+
+# Transposition table: zobrist key -> (depth, score, flag, best_move).
+# Iterative deepening re-searches the same tree every iteration, and move
+# transpositions reach identical positions constantly; caching results cuts
+# nodes by an order of magnitude at depth >= 4. Cleared on ucinewgame and
+# when full (entries regenerate within a few nodes).
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+TT_MAX_ENTRIES: int = 1 << 20
+transposition_table: dict[int, tuple] = {}
+TIME_CHECK_NODES: int = 2_048  # power of two so the counter check is a bit-mask
+TIME_CHECK_MASK: int = TIME_CHECK_NODES - 1
 TIME_USAGE_FRACTION: float = 0.9
 
+# Delta pruning: in quiescence, skip a capture when even winning the victim
+# outright plus this safety margin cannot lift the score back to alpha.
+DELTA_PRUNING_MARGIN: int = 200
+# ...but not in late endgames (phase below this), where a "hopeless" capture
+# can still matter (passed-pawn races, zugzwang-like positions).
+DELTA_PRUNING_MIN_PHASE: int = 4
+
 # ---------------------------------------------------------------------------
 # PeSTO piece-square tables
 # ---------------------------------------------------------------------------
@@ -189,6 +209,21 @@ PST: dict[int, tuple[list[int], list[int]]] = {
     chess.KING:   (MG_KING_TABLE,   EG_KING_TABLE),
 }
 
+# Flat PST arrays: one table per game phase, indexed by piece_type * 64 + idx.
+# The eval hot paths probe tables several times per move; a flat table turns
+# each probe into plain index arithmetic instead of a dict hash plus tuple
+# unpack. Packed as array.array("h") — C int16s, ~900 bytes per table instead
+# of a list of boxed PyObject ints — so both tables sit comfortably in L1
+# cache. Indexing an array.array still yields a plain Python int.
+_mg_flat: list[int] = [0] * (7 * 64)
+_eg_flat: list[int] = [0] * (7 * 64)
+for _pt, (_mg_tbl, _eg_tbl) in PST.items():
+    _mg_flat[_pt * 64:(_pt + 1) * 64] = _mg_tbl
+    _eg_flat[_pt * 64:(_pt + 1) * 64] = _eg_tbl
+PST_MG_FLAT = array.array("h", _mg_flat)
+PST_EG_FLAT = array.array("h", _eg_flat)
+del _mg_flat, _eg_flat
+
 PHASE_WEIGHTS: dict[int, int] = {
     chess.PAWN:   0,
     chess.KNIGHT: 1,
@@ -204,8 +239,9 @@ MAX_PHASE: int = 24
 # ---------------------------------------------------------------------------
 
 
-def evaluate(board: chess.Board) -> int:
-    """Tapered PeSTO evaluation from side-to-move perspective (centipawns)."""
+def _full_terms(board: chess.Board) -> tuple[int, int, int]:
+    """Full-board scan: White-relative (mg, eg, phase) totals. Used only to
+    seed the incremental Accumulator at the root of a search."""
     mg_score = 0
     eg_score = 0
     phase = 0
@@ -215,42 +251,203 @@ def evaluate(board: chess.Board) -> int:
         if piece is None:
             continue
         pt = piece.piece_type
-        mg_table, eg_table = PST[pt]
+        base = pt * 64
         material = 0 if pt == chess.KING else PIECE_VALUES[pt]
 
-        if piece.color == chess.WHITE:
-            idx = sq ^ 56
-            mg_score += material + mg_table[idx]
-            eg_score += material + eg_table[idx]
-        else:
-            idx = sq
-            mg_score -= material + mg_table[idx]
-            eg_score -= material + eg_table[idx]
+        # Branchless color handling: piece.color is a bool (1 = White), so
+        # 56 * color_bit applies the rank mirror only for White pieces and
+        # (color_bit << 1) - 1 maps {1, 0} to {+1, -1} for the sign — no
+        # per-piece branch in the inner loop.
+        color_bit = int(piece.color)
+        sign = (color_bit << 1) - 1
+        idx = base + (sq ^ (56 * color_bit))
+        mg_score += sign * (material + PST_MG_FLAT[idx])
+        eg_score += sign * (material + PST_EG_FLAT[idx])
 
         phase += PHASE_WEIGHTS.get(pt, 0)
 
+    return mg_score, eg_score, phase
+
+
+def evaluate(board: chess.Board) -> int:
+    """Tapered PeSTO evaluation from side-to-move perspective (centipawns)."""
+    mg_score, eg_score, phase = _full_terms(board)
     phase = min(phase, MAX_PHASE)
     tapered = (mg_score * phase + eg_score * (MAX_PHASE - phase)) // MAX_PHASE
     return tapered if board.turn == chess.WHITE else -tapered
 
 
+class Accumulator:
+    """
+    Incremental material + PST + phase accumulator.
+
+    evaluate() walks all 64 squares, which makes it the hottest loop in the
+    engine — it runs at every quiescence node. But a single move only touches
+    a handful of squares, so instead of rescanning the board we keep running
+    middlegame/endgame totals plus the game-phase counter and apply an O(1)
+    delta on every push. pop() undoes the delta from a stack, so unmake is
+    free. The accumulator is seeded once per search and must be kept in
+    lock-step with the board's own push/pop.
+
+    The totals are stored relative to the side to move, not to White: every
+    push negates them after applying the mover's delta, mirroring how
+    negamax negates child scores. Two wins: the deltas need no per-side sign
+    multiplications (the PST index mirror already handles color), and
+    tapered() is a single branch-free expression.
+    """
+
+    __slots__ = ("mg", "eg", "phase", "stack")
+
+    def __init__(self, board: chess.Board) -> None:
+        mg, eg, self.phase = _full_terms(board)
+        if board.turn == chess.WHITE:
+            self.mg, self.eg = mg, eg
+        else:
+            self.mg, self.eg = -mg, -eg
+        self.stack: list[tuple[int, int, int]] = []
+
+    def push(self, board: chess.Board, move: chess.Move) -> None:
+        """Apply the eval delta for `move`. Must be called BEFORE board.push."""
+        mover = board.piece_type_at(move.from_square)
+        white = board.turn == chess.WHITE
+        base = mover * 64
+
+        # All deltas are computed in the mover's own frame; the index mirror
+        # (sq ^ 56 for White) makes the tables color-agnostic.
+        from_idx = move.from_square ^ 56 if white else move.from_square
+        to_idx = move.to_square ^ 56 if white else move.to_square
+
+        d_mg = PST_MG_FLAT[base + to_idx] - PST_MG_FLAT[base + from_idx]
+        d_eg = PST_EG_FLAT[base + to_idx] - PST_EG_FLAT[base + from_idx]
+        d_phase = 0
+
+        victim = board.piece_type_at(move.to_square)
+        cap_sq = move.to_square
+        if victim is None and mover == chess.PAWN and move.to_square == board.ep_square:
+            # En passant: the captured pawn sits behind the destination square.
+            victim = chess.PAWN
+            cap_sq = move.to_square - 8 if white else move.to_square + 8
+        if victim is not None:
+            # Victim has the opposite color, so its index mirrors the mover's.
+            cap_idx = victim * 64 + (cap_sq if white else cap_sq ^ 56)
+            d_mg += PIECE_VALUES[victim] + PST_MG_FLAT[cap_idx]
+            d_eg += PIECE_VALUES[victim] + PST_EG_FLAT[cap_idx]
+            d_phase -= PHASE_WEIGHTS[victim]
+
+        if move.promotion is not None:
+            # The pawn vanishes on the back rank and the promoted piece appears.
+            promo_idx = move.promotion * 64 + to_idx
+            promo_material = PIECE_VALUES[move.promotion] - PIECE_VALUES[chess.PAWN]
+            d_mg += promo_material + PST_MG_FLAT[promo_idx] - PST_MG_FLAT[base + to_idx]
+            d_eg += promo_material + PST_EG_FLAT[promo_idx] - PST_EG_FLAT[base + to_idx]
+            d_phase += PHASE_WEIGHTS[move.promotion]
+
+        if mover == chess.KING and board.is_castling(move):
+            # Account for the rook hop: h-file rook to f, or a-file rook to d.
+            if chess.square_file(move.to_square) == 6:  # kingside
+                rook_from, rook_to = move.to_square + 1, move.to_square - 1
+            else:  # queenside
+                rook_from, rook_to = move.to_square - 2, move.to_square + 1
+            rook_base = chess.ROOK * 64
+            rf_idx = rook_base + (rook_from ^ 56 if white else rook_from)
+            rt_idx = rook_base + (rook_to ^ 56 if white else rook_to)
+            d_mg += PST_MG_FLAT[rt_idx] - PST_MG_FLAT[rf_idx]
+            d_eg += PST_EG_FLAT[rt_idx] - PST_EG_FLAT[rf_idx]
+
+        # Apply in the mover's frame, then flip to the new side to move.
+        self.mg = -(self.mg + d_mg)
+        self.eg = -(self.eg + d_eg)
+        self.phase += d_phase
+        self.stack.append((d_mg, d_eg, d_phase))
+
+    def pop(self) -> None:
+        """Undo the most recent push."""
+        d_mg, d_eg, d_phase = self.stack.pop()
+        self.mg = -self.mg - d_mg
+        self.eg = -self.eg - d_eg
+        self.phase -= d_phase
+
+    def tapered(self) -> int:
+        """
+        Blended score for the side to move, in centipawns.
+
+        The phase extremes are special-cased: in pure pawn endgames
+        (phase 0) the middlegame term is multiplied by zero anyway, and
+        with full material (phase >= 24) the endgame term is — both common
+        in deep quiescence trees, and each short-circuit saves two
+        multiplications and a division per stand-pat.
+        """
+        phase = self.phase
+        if phase <= 0:
+            return self.eg
+        if phase >= MAX_PHASE:
+            return self.mg
+        return (self.mg * phase + self.eg * (MAX_PHASE - phase)) // MAX_PHASE
+
+
 # ---------------------------------------------------------------------------
 # Move ordering
 # ---------------------------------------------------------------------------
 
 
-def _order_moves(board: chess.Board, moves: Iterable[chess.Move]) -> list[chess.Move]:
-    """Order moves by MVV-LVA: captures first (high-value victim, low-value attacker)."""
+def _order_moves(
+    board: chess.Board,
+    moves: Iterable[chess.Move],
+    tt_move: chess.Move | None = None,
+    killers: list | None = None,
+    history: list | None = None,
+):
+    """
+    Yield moves best-first: TT move, MVV-LVA captures, killers, then quiets
+    ranked by history score.
+
+    Killer moves are quiet moves that caused a beta cutoff at the same ply in
+    a sibling subtree — likely refutations here too, so they rank just below
+    captures. The history table accumulates depth*depth credit for quiet
+    cutoff moves anywhere in the tree and breaks ties among the rest.
+
+    With good ordering the first move causes a beta cutoff at the vast
+    majority of nodes, so fully sorting the list is wasted work. Instead we
+    score every move once, then on each iteration swap the current best to
+    the end and pop it — selection sort, but lazily: a cutoff after move one
+    pays for a single linear scan rather than an O(N log N) sort.
+    """
+    # Capture detection via one bitboard test instead of board.is_capture()
+    # (a method call with its own en-passant branch), and piece_type_at()
+    # instead of piece_at() so no Piece objects are allocated while scoring.
+    them = board.occupied_co[not board.turn]
+    ep_square = board.ep_square
+    piece_type_at = board.piece_type_at
+
     def _score(move: chess.Move) -> int:
-        if not board.is_capture(move):
-            return 0
-        attacker = board.piece_at(move.from_square)
-        victim = board.piece_at(move.to_square)
-        attacker_val = PIECE_VALUES.get(attacker.piece_type, 0) if attacker else 0
-        victim_val = PIECE_VALUES.get(victim.piece_type, 0) if victim else PIECE_VALUES[chess.PAWN]
-        return 10_000 + victim_val - attacker_val
+        if move == tt_move:
+            return 1_000_000  # Best move from a previous visit of this position
+        to_square = move.to_square
+        if (1 << to_square) & them:
+            victim_val = PIECE_VALUES[piece_type_at(to_square)]
+            attacker_val = PIECE_VALUES[piece_type_at(move.from_square)]
+            return 10_000 + victim_val - attacker_val
+        if to_square == ep_square and piece_type_at(move.from_square) == chess.PAWN:
+            return 10_000  # En passant: pawn takes pawn, victim - attacker = 0
+        if killers is not None:
+            if move == killers[0]:
+                return 9_000
+            if move == killers[1]:
+                return 8_000
+        if history is not None:
+            # Cap below the killer scores so a hot history move can't
+            # outrank an actual killer.
+            return min(history[move.from_square * 64 + move.to_square], 7_999)
+        return 0
 
-    return sorted(moves, key=_score, reverse=True)
+    move_list = list(moves)
+    scores = [_score(m) for m in move_list]
+    while move_list:
+        best = max(range(len(move_list)), key=scores.__getitem__)
+        move_list[best], move_list[-1] = move_list[-1], move_list[best]
+        scores[best], scores[-1] = scores[-1], scores[best]
+        scores.pop()
+        yield move_list.pop()
 
 
 # ---------------------------------------------------------------------------
@@ -258,37 +455,92 @@ def _order_moves(board: chess.Board, moves: Iterable[chess.Move]) -> list[chess.
 # ---------------------------------------------------------------------------
 
 
-def quiescence(board: chess.Board, alpha: int, beta: int, ply: int, state: dict) -> int:
+class SearchCtx:
+    """
+    Mutable per-search state shared by every node of one get_best_move call.
+
+    __slots__ makes each field a fixed-offset attribute, so the node counter
+    bump and abort probe are C-level slot accesses instead of the dict hash
+    plus string compare a state-dict lookup cost on every node visit — the
+    most numerous operation in the engine.
+    """
+
+    __slots__ = (
+        "stop", "poll", "aborted", "nodes", "deadline",
+        "best_move", "best_score", "acc", "killers", "history",
+    )
+
+    def __init__(self, board: chess.Board, time_limit_ms: int,
+                 stop_event: threading.Event, poll=None) -> None:
+        self.stop = stop_event
+        # Optional zero-argument callable probed alongside the clock; lets a
+        # synchronous UCI loop notice "stop" on stdin without a helper thread.
+        self.poll = poll
+        self.aborted = False
+        self.nodes = 0
+        # Precomputed absolute deadline: the in-search check is then a single
+        # monotonic read and compare, no arithmetic per check.
+        self.deadline = time.monotonic() + time_limit_ms / 1000.0 * TIME_USAGE_FRACTION
+        self.best_move: chess.Move | None = None
+        self.best_score = 0
+        self.acc = Accumulator(board)
+        self.killers: list[list] = [[None, None] for _ in range(MAX_DEPTH + 1)]
+        self.history: list[int] = [0] * 4096
+
+
+def quiescence(board: chess.Board, alpha: int, beta: int, ply: int, ctx: SearchCtx) -> int:
     """
     Quiescence search: continue searching captures until position is quiet.
 
     Stand-pat: static evaluation serves as a lower bound (we can always stop here).
     If stand_pat >= beta, prune immediately. Otherwise search captures.
     """
-    if state["stop"].is_set():
+    if ctx.aborted:
         return 0
 
-    state["nodes"] += 1
-
-    # Time check: must also check here — quiescence can dominate node counts
-    # in tactical positions, causing negamax's check to never fire.
-    if state["nodes"] % TIME_CHECK_NODES == 0:
-        elapsed_ms = (time.monotonic() - state["start_time"]) * 1000
-        if elapsed_ms >= state["time_limit_ms"] * TIME_USAGE_FRACTION:
-            state["stop"].set()
+    ctx.nodes += 1
+
+    # Batched abort check: stop-event polling and the clock are method calls,
+    # so probe them only every TIME_CHECK_NODES nodes; the sticky aborted
+    # flag then unwinds every open node with a single slot read. Must also
+    # check here — quiescence can dominate node counts in tactical positions.
+    if ctx.nodes & TIME_CHECK_MASK == 0:
+        if (ctx.stop.is_set() or time.monotonic() >= ctx.deadline
+                or (ctx.poll is not None and ctx.poll())):
+            ctx.stop.set()
+            ctx.aborted = True
             return 0
 
-    stand_pat = evaluate(board)
+    # Stand-pat from the incremental accumulator: O(1) instead of the
+    # 64-square scan that used to dominate the profile.
+    acc = ctx.acc
+    stand_pat = acc.tapered()
     if stand_pat >= beta:
         return beta
     if stand_pat > alpha:
         alpha = stand_pat
 
-    captures = [m for m in board.legal_moves if board.is_capture(m)]
+    # Generate only capturing moves instead of filtering the full legal-move
+    # list: quiescence never searches quiets, so generating them (the large
+    # majority in most positions) was pure waste. Pseudo-legal generation
+    # plus an is_legal() check is how python-chess does this cheaply.
+    captures = [m for m in board.generate_pseudo_legal_captures() if board.is_legal(m)]
+    use_delta = acc.phase >= DELTA_PRUNING_MIN_PHASE
     for move in _order_moves(board, captures):
+        # Delta pruning: if capturing this victim can't possibly raise the
+        # score back to alpha even with a generous margin, don't bother
+        # recursing. Promotions are exempt (they gain far more than the
+        # victim's value).
+        if use_delta and move.promotion is None:
+            victim_pt = board.piece_type_at(move.to_square)
+            victim_val = PIECE_VALUES[victim_pt] if victim_pt else PAWN_VALUE  # ep
+            if stand_pat + victim_val + DELTA_PRUNING_MARGIN < alpha:
+                continue
+        acc.push(board, move)
         board.push(move)
-        score = -quiescence(board, -beta, -alpha, ply + 1, state)
+        score = -quiescence(board, -beta, -alpha, ply + 1, ctx)
         board.pop()
+        acc.pop()
 
         if score >= beta:
             return beta
@@ -298,38 +550,73 @@ def quiescence(board: chess.Board, alpha: int, beta: int, ply: int, state: dict)
     return alpha
 
 
-def negamax(board: chess.Board, depth: int, alpha: int, beta: int, ply: int, state: dict) -> int:
+def negamax(board: chess.Board, depth: int, alpha: int, beta: int, ply: int, ctx: SearchCtx) -> int:
     """
     Negamax with alpha-beta pruning. Returns score from side-to-move perspective.
 
-    At depth 0, drops into quiescence search. Uses MVV-LVA move ordering.
-    Checks time every TIME_CHECK_NODES nodes.
+    At depth 0, drops into quiescence search. Uses TT/MVV-LVA/killer/history
+    move ordering. Checks the clock every TIME_CHECK_NODES nodes.
     """
-    if state["stop"].is_set():
+    if ctx.aborted:
         return 0
 
-    state["nodes"] += 1
+    ctx.nodes += 1
 
-    # Periodic time check
-    if state["nodes"] % TIME_CHECK_NODES == 0:
-        elapsed_ms = (time.monotonic() - state["start_time"]) * 1000
-        if elapsed_ms >= state["time_limit_ms"] * TIME_USAGE_FRACTION:
-            state["stop"].set()
+    # Batched abort check (see quiescence for the rationale).
+    if ctx.nodes & TIME_CHECK_MASK == 0:
+        if (ctx.stop.is_set() or time.monotonic() >= ctx.deadline
+                or (ctx.poll is not None and ctx.poll())):
+            ctx.stop.set()
+            ctx.aborted = True
             return 0
 
-    if board.is_game_over():
-        return -(CHECKMATE_SCORE - ply) if board.is_checkmate() else 0
+    # Terminal handling, decomposed: board.is_game_over() ran a checkmate
+    # test, a stalemate test, an insufficient-material scan AND a fivefold
+    # repetition walk at every node. Instead, cheap draw screens run here
+    # (one integer compare for the fifty-move rule; a repetition inside the
+    # search stack scores as a draw immediately — the opponent can force the
+    # repeat), and mate/stalemate falls out of the move loop below finding
+    # no legal moves at all.
+    if ply > 0 and (board.halfmove_clock >= 100 or board.is_repetition(2)):
+        return 0
 
     if depth == 0:
-        return quiescence(board, alpha, beta, ply, state)
+        if board.legal_moves:
+            return quiescence(board, alpha, beta, ply, ctx)
+        return -(CHECKMATE_SCORE - ply) if board.is_check() else 0
+
+    # Transposition table probe: a stored result searched at least as deep
+    # as we need either answers the node outright (EXACT) or tightens the
+    # window (bound flags). Shallower entries still donate their best move
+    # to the ordering. Mate scores are never stored, so no ply rebasing.
+    key = chess.polyglot.zobrist_hash(board)
+    tt_move = None
+    entry = transposition_table.get(key)
+    if entry is not None:
+        entry_depth, entry_score, entry_flag, tt_move = entry
+        if entry_depth >= depth and ply > 0:
+            if entry_flag == TT_EXACT:
+                return entry_score
+            if entry_flag == TT_LOWER and entry_score > alpha:
+                alpha = entry_score
+            elif entry_flag == TT_UPPER and entry_score < beta:
+                beta = entry_score
+            if alpha >= beta:
+                return entry_score
+    alpha_original = alpha
 
     best_score = -CHECKMATE_SCORE
     best_move = None
 
-    for move in _order_moves(board, board.legal_moves):
+    acc = ctx.acc
+    killers = ctx.killers[ply]
+    history = ctx.history
+    for move in _order_moves(board, board.legal_moves, tt_move, killers, history):
+        acc.push(board, move)
         board.push(move)
-        score = -negamax(board, depth - 1, -beta, -alpha, ply + 1, state)
+        score = -negamax(board, depth - 1, -beta, -alpha, ply + 1, ctx)
         board.pop()
+        acc.pop()
 
         if score > best_score:
             best_score = score
@@ -339,16 +626,43 @@ def negamax(board: chess.Board, depth: int, alpha: int, beta: int, ply: int, sta
             alpha = best_score
 
         if alpha >= beta:
+            # A quiet move refuted this whole node: remember it as a killer
+            # for sibling nodes at this ply and credit its from/to squares in
+            # the history table (deeper cutoffs earn more).
+            if not board.is_capture(move) and move.promotion is None:
+                if killers[0] != move:
+                    killers[1] = killers[0]
+                    killers[0] = move
+                history[move.from_square * 64 + move.to_square] += depth * depth
             break
 
+    # No legal move at all: checkmate or stalemate (the old per-node
+    # is_game_over() caught this before the loop).
+    if best_move is None and best_score == -CHECKMATE_SCORE and not ctx.aborted:
+        return -(CHECKMATE_SCORE - ply) if board.is_check() else 0
+
+    # Store — unless the search was stopped (score is garbage) or the score
+    # is a mate (ply-relative; rebasing isn't worth it at these depths).
+    if not ctx.aborted and abs(best_score) < CHECKMATE_SCORE - 100:
+        if best_score <= alpha_original:
+            flag = TT_UPPER
+        elif best_score >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        if len(transposition_table) >= TT_MAX_ENTRIES:
+            transposition_table.clear()
+        transposition_table[key] = (depth, best_score, flag, best_move)
+
     if ply == 0:
-        state["best_move"] = best_move
-        state["best_score"] = best_score
+        ctx.best_move = best_move
+        ctx.best_score = best_score
 
     return best_score
 
 
-def get_best_move(board: chess.Board, time_limit_ms: int, stop_event: threading.Event):
+def get_best_move(board: chess.Board, time_limit_ms: int, stop_event: threading.Event,
+                  poll=None):
     """
     Iterative deepening search. Returns (move, score_cp, depth).
 
@@ -359,14 +673,7 @@ def get_best_move(board: chess.Board, time_limit_ms: int, stop_event: threading.
         return (None, 0, 0)
 
     start_time = time.monotonic()
-    state = {
-        "stop": stop_event,
-        "nodes": 0,
-        "best_move": None,
-        "best_score": 0,
-        "time_limit_ms": float(time_limit_ms),
-        "start_time": start_time,
-    }
+    ctx = SearchCtx(board, time_limit_ms, stop_event, poll)
 
     completed_depth = 0
 
@@ -375,20 +682,35 @@ def get_best_move(board: chess.Board, time_limit_ms: int, stop_event: threading.
         if elapsed_ms >= float(time_limit_ms) * TIME_USAGE_FRACTION:
             break
 
-        prev_best_move = state["best_move"]
-        prev_best_score = state["best_score"]
-
-        negamax(board, depth, -CHECKMATE_SCORE, CHECKMATE_SCORE, 0, state)
+        prev_best_move = ctx.best_move
+        prev_best_score = ctx.best_score
 
-        if state["stop"].is_set():
+        # Aspiration windows: the score rarely moves much between iterations,
+        # so search a narrow window around the previous score first — tighter
+        # root bounds mean more cutoffs throughout the tree. On a fail
+        # high/low, widen to +/-200, then to full width. Mate scores and the
+        # first iteration get a full window straight away.
+        if completed_depth == 0 or abs(prev_best_score) >= CHECKMATE_SCORE - 100:
+            negamax(board, depth, -CHECKMATE_SCORE, CHECKMATE_SCORE, 0, ctx)
+        else:
+            for margin in (50, 200):
+                alpha = prev_best_score - margin
+                beta = prev_best_score + margin
+                score = negamax(board, depth, alpha, beta, 0, ctx)
+                if ctx.aborted or alpha < score < beta:
+                    break
+            else:
+                negamax(board, depth, -CHECKMATE_SCORE, CHECKMATE_SCORE, 0, ctx)
+
+        if ctx.aborted or stop_event.is_set():
             if prev_best_move is not None:
-                state["best_move"] = prev_best_move
-                state["best_score"] = prev_best_score
+                ctx.best_move = prev_best_move
+                ctx.best_score = prev_best_score
             break
 
         completed_depth = depth
 
-    return (state["best_move"], state["best_score"], completed_depth)
+    return (ctx.best_move, ctx.best_score, completed_depth)
 
 
 # ---------------------------------------------------------------------------
@@ -404,112 +726,184 @@ def _log(msg: str) -> None:
     print(msg, file=sys.stderr, flush=True)
 
 
+# `go` arguments that take an integer value. Everything else is skipped.
+_GO_INT_KEYS = frozenset(
+    {"wtime", "btime", "winc", "binc", "movetime", "depth", "nodes", "movestogo"}
+)
+
+
 def _parse_go_time(tokens: list[str], turn: bool) -> int:
+    """
+    Extract a millisecond budget from `go` arguments.
+
+    One forward pass over known keywords with an isdigit() check — no
+    exception machinery on malformed input (raising and catching ValueError
+    per unknown token is expensive and this runs on every move).
+    """
     params: dict[str, int] = {}
-    i = 0
-    while i < len(tokens) - 1:
-        try:
-            params[tokens[i]] = int(tokens[i + 1])
-            i += 2
-        except (ValueError, IndexError):
-            i += 1
+    it = iter(tokens)
+    for tok in it:
+        if tok in _GO_INT_KEYS:
+            value = next(it, None)
+            if value is not None and value.lstrip("-").isdigit():
+                params[tok] = int(value)
     if "movetime" in params:
         return params["movetime"]
-    time_key = "wtime" if turn == chess.WHITE else "btime"
-    inc_key = "winc" if turn == chess.WHITE else "binc"
+    time_key, inc_key = ("wtime", "winc") if turn == chess.WHITE else ("btime", "binc")
     if time_key in params:
+        # Budget ~1/40th of remaining clock plus the increment.
         return max(1, params[time_key] // 40 + params.get(inc_key, 0))
-    return 10_000_000
+    return 10_000_000  # effectively infinite: wait for "stop"
+
+
+class UciLoop:
+    """
+    UCI main loop: synchronous search with cooperative stdin polling.
+
+    There is no search thread. The GIL means a helper thread buys no
+    parallelism anyway, and every cross-thread stop_event probe from the
+    search was a C-API trip. Instead the search runs in the main thread
+    and, inside its periodic abort check, polls stdin through a selector:
+    "stop"/"quit" abort the search, "isready" is answered immediately, and
+    anything else is queued for after bestmove.
+
+    Commands dispatch through a dict of bound methods — one hash lookup per
+    line instead of a chain of string comparisons, which matters when GUIs
+    hammer isready during tournament handshakes.
+    """
+
+    def __init__(self) -> None:
+        self.board = chess.Board()
+        self.sel = selectors.DefaultSelector()
+        self.stdin_fd = sys.stdin.fileno()
+        self.sel.register(self.stdin_fd, selectors.EVENT_READ)
+        self.pending = b""           # partial line carried between reads
+        self.queued: list[str] = []  # complete lines awaiting dispatch
+        self.quit_seen = False
+        self.handlers = {
+            "uci": self._handle_uci,
+            "isready": self._handle_isready,
+            "ucinewgame": self._handle_ucinewgame,
+            "position": self._handle_position,
+            "go": self._handle_go,
+            "stop": self._handle_stop,
+            "quit": self._handle_quit,
+        }
+
+    # -- stdin plumbing ----------------------------------------------------
+
+    def _drain_stdin(self, timeout) -> None:
+        """Read whatever is available on stdin into the queued-line list."""
+        if not self.sel.select(timeout):
+            return
+        chunk = os.read(self.stdin_fd, 4096)
+        if not chunk:  # EOF: treat like quit
+            self.quit_seen = True
+            return
+        self.pending += chunk
+        head, sep, self.pending = self.pending.rpartition(b"\n")
+        if sep:
+            self.queued.extend(head.decode(errors="replace").split("\n"))
+
+    def _poll_stop(self) -> bool:
+        """Called from inside the search: True if "stop"/"quit" arrived."""
+        self._drain_stdin(0)
+        if not self.queued:
+            return self.quit_seen
+        keep: list[str] = []
+        stop_requested = False
+        for raw in self.queued:
+            word = raw.strip()
+            if word == "stop":
+                stop_requested = True
+            elif word == "quit":
+                self.quit_seen = True
+            elif word == "isready":
+                _send("readyok")  # GUIs ping during long searches
+            elif word:
+                keep.append(raw)
+        self.queued[:] = keep
+        return stop_requested or self.quit_seen
+
+    # -- command handlers --------------------------------------------------
+
+    def _handle_uci(self, args: list[str]) -> None:
+        _send("id name ChessAI-v4")
+        _send("id author Chess AI Project")
+        _send("uciok")
+
+    def _handle_isready(self, args: list[str]) -> None:
+        _send("readyok")
+
+    def _handle_ucinewgame(self, args: list[str]) -> None:
+        self.board = chess.Board()
+        transposition_table.clear()
+
+    def _handle_position(self, args: list[str]) -> None:
+        if not args:
+            return
+        if args[0] == "startpos":
+            self.board = chess.Board()
+            move_tokens = args[2:] if len(args) > 1 and args[1] == "moves" else []
+        elif args[0] == "fen":
+            if "moves" in args:
+                idx = args.index("moves")
+                self.board = chess.Board(" ".join(args[1:idx]))
+                move_tokens = args[idx + 1:]
+            else:
+                self.board = chess.Board(" ".join(args[1:]))
+                move_tokens = []
+        else:
+            return
+        for uci_move in move_tokens:
+            m = chess.Move.from_uci(uci_move)
+            if m in self.board.legal_moves:
+                self.board.push(m)
+
+    def _handle_go(self, args: list[str]) -> None:
+        time_ms = _parse_go_time(args, self.board.turn)
+        t0 = time.monotonic()
+        move, score, depth = get_best_move(
+            self.board, time_ms, threading.Event(), poll=self._poll_stop
+        )
+        elapsed = max(1, int((time.monotonic() - t0) * 1000))
+        if move is not None:
+            _send(f"info depth {depth} score cp {score} time {elapsed}")
+            _send(f"bestmove {move.uci()}")
+        else:
+            _send("bestmove (none)")
+
+    def _handle_stop(self, args: list[str]) -> None:
+        pass  # search runs synchronously; nothing in flight here
+
+    def _handle_quit(self, args: list[str]) -> None:
+        self.quit_seen = True
+
+    # -- main loop ---------------------------------------------------------
+
+    def run(self) -> None:
+        while not self.quit_seen:
+            if not self.queued:
+                self._drain_stdin(None)  # block until input arrives
+                continue
+            line = self.queued.pop(0).strip()
+            if not line:
+                continue
+            tokens = line.split()
+            cmd = tokens[0]
+            handler = self.handlers.get(cmd)
+            if handler is None:
+                continue  # unknown commands are ignored, per UCI convention
+            try:
+                handler(tokens[1:])
+            except Exception as e:
+                _log(f"error handling {cmd!r}: {e}")
 
 
 def run_uci_loop() -> None:
-    board = chess.Board()
-    search_thread: threading.Thread | None = None
-    stop_event = threading.Event()
+    """Entry point kept for symmetry with the other snapshots."""
+    UciLoop().run()
 
-    for raw_line in sys.stdin:
-        line = raw_line.strip()
-        if not line:
-            continue
-        tokens = line.split()
-        cmd = tokens[0]
-        args = tokens[1:]
-
-        try:
-            if cmd == "uci":
-                _send("id name ChessAI-v4")
-                _send("id author Chess AI Project")
-                _send("uciok")
-
-            elif cmd == "isready":
-                _send("readyok")
-
-            elif cmd == "ucinewgame":
-                stop_event.set()
-                if search_thread and search_thread.is_alive():
-                    search_thread.join(timeout=2.0)
-                board = chess.Board()
-                stop_event = threading.Event()
-
-            elif cmd == "position":
-                if not args:
-                    continue
-                if args[0] == "startpos":
-                    board = chess.Board()
-                    move_tokens = args[2:] if len(args) > 1 and args[1] == "moves" else []
-                elif args[0] == "fen":
-                    if "moves" in args:
-                        idx = args.index("moves")
-                        board = chess.Board(" ".join(args[1:idx]))
-                        move_tokens = args[idx + 1:]
-                    else:
-                        board = chess.Board(" ".join(args[1:]))
-                        move_tokens = []
-                else:
-                    continue
-                for uci_move in move_tokens:
-                    m = chess.Move.from_uci(uci_move)
-                    if m in board.legal_moves:
-                        board.push(m)
-
-            elif cmd == "go":
-                stop_event.set()
-                if search_thread and search_thread.is_alive():
-                    search_thread.join(timeout=2.0)
-                stop_event = threading.Event()
-                time_ms = _parse_go_time(args, board.turn)
-                board_copy = board.copy()
-                _stop = stop_event
-
-                def _run(b=board_copy, ms=time_ms, s=_stop):
-                    try:
-                        t0 = time.monotonic()
-                        move, score, depth = get_best_move(b, ms, s)
-                        elapsed = max(1, int((time.monotonic() - t0) * 1000))
-                        nodes = 1  # approximate; state not accessible here
-                        if move is not None:
-                            _send(f"info depth {depth} score cp {score} nodes {nodes} nps 1 time {elapsed}")
-                            _send(f"bestmove {move.uci()}")
-                        else:
-                            _send("bestmove (none)")
-                    except Exception as e:
-                        _log(f"search error: {e}")
-                        _send("bestmove (none)")
-
-                search_thread = threading.Thread(target=_run, daemon=True)
-                search_thread.start()
-
-            elif cmd == "stop":
-                stop_event.set()
-                if search_thread and search_thread.is_alive():
-                    search_thread.join(timeout=2.0)
-
-            elif cmd == "quit":
-                stop_event.set()
-                sys.exit(0)
-
-        except Exception as e:
-            _log(f"error handling {cmd!r}: {e}")
 
 
 if __name__ == "__main__":
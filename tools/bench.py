@@ -32,19 +32,12 @@ POSITIONS = [
 ]
 
 
-def run_position(label: str, pos_spec: str) -> dict:
-    """Run a single position through the engine and return metrics.
+def start_engine() -> subprocess.Popen:
+    """Spawn the UCI engine once and complete the uci/isready handshake.
 
-    Spawns the UCI engine as a subprocess, sends the position with a
-    generous movetime (60s) so the search always completes, then parses
-    the final 'info depth' line for node count, NPS, and time.
-
-    Args:
-        label: Human-readable position name for display.
-        pos_spec: UCI position string (e.g. "startpos" or "fen <FEN>").
-
-    Returns:
-        Dict with keys: label, move, depth, score, nodes, nps, time_ms.
+    Interpreter startup plus `import chess` costs a few hundred milliseconds;
+    UCI is designed for long-lived sessions, so one process serves every
+    benchmark position and `ucinewgame` resets state in between.
     """
     env = {**os.environ, "PYTHONPATH": REPO}
     proc = subprocess.Popen(
@@ -55,45 +48,63 @@ def run_position(label: str, pos_spec: str) -> dict:
         text=True,
         env=env,
     )
-    cmds = f"uci\nisready\nposition {pos_spec}\ngo movetime 60000\n"
-    proc.stdin.write(cmds)
+    proc.stdin.write("uci\nisready\n")
     proc.stdin.flush()
+    for line in proc.stdout:
+        if line.strip() == "readyok":
+            break
+    return proc
+
+
+def _parse_info_line(line: str) -> dict:
+    """Extract integer fields from an 'info depth ...' line."""
+    parts = line.split()
+
+    def _get(key: str) -> int:
+        try:
+            return int(parts[parts.index(key) + 1])
+        except (ValueError, IndexError):
+            return 0
+
+    return {
+        "depth": _get("depth"),
+        "score": _get("cp"),
+        "nodes": _get("nodes"),
+        "nps": _get("nps"),
+        "time_ms": _get("time"),
+    }
+
+
+def run_position(proc: subprocess.Popen, label: str, pos_spec: str) -> dict:
+    """Run a single position through an already-running engine.
+
+    Sends `ucinewgame` (clearing the transposition table so every position
+    starts cold — node counts stay comparable across runs), then the position
+    with a generous movetime (60s) so the search always completes, and parses
+    the final 'info depth' line for node count, NPS, and time.
 
-    nodes = time_ms = nps = depth = score = 0
+    Args:
+        proc: Engine process from start_engine().
+        label: Human-readable position name for display.
+        pos_spec: UCI position string (e.g. "startpos" or "fen <FEN>").
+
+    Returns:
+        Dict with keys: label, move, depth, score, nodes, nps, time_ms.
+    """
+    proc.stdin.write(f"ucinewgame\nposition {pos_spec}\ngo movetime 60000\n")
+    proc.stdin.flush()
+
+    metrics = {"depth": 0, "score": 0, "nodes": 0, "nps": 0, "time_ms": 0}
     move = "(none)"
     for line in proc.stdout:
         line = line.strip()
         if line.startswith("info depth"):
-            parts = line.split()
-
-            def _get(key: str) -> int:
-                try:
-                    return int(parts[parts.index(key) + 1])
-                except (ValueError, IndexError):
-                    return 0
-
-            depth = _get("depth")
-            score = _get("cp")
-            nodes = _get("nodes")
-            nps = _get("nps")
-            time_ms = _get("time")
+            metrics = _parse_info_line(line)
         elif line.startswith("bestmove"):
             move = line.split()[1]
             break
 
-    proc.stdin.write("quit\n")
-    proc.stdin.flush()
-    proc.wait(timeout=5)
-
-    return {
-        "label": label,
-        "move": move,
-        "depth": depth,
-        "score": score,
-        "nodes": nodes,
-        "nps": nps,
-        "time_ms": time_ms,
-    }
+    return {"label": label, "move": move, **metrics}
 
 
 def main() -> None:
@@ -107,9 +118,10 @@ def main() -> None:
     )
     print("-" * 68)
 
+    proc = start_engine()
     results = []
     for label, pos in POSITIONS:
-        r = run_position(label, pos)
+        r = run_position(proc, label, pos)
         results.append(r)
         print(
             f"{r['label']:<14} {r['move']:<7} {r['depth']:>5} {r['score']:>6} "
@@ -126,6 +138,10 @@ def main() -> None:
             f"{'AVERAGE':<14} {'':<7} {'':<5} {'':<6} "
             f"{avg_nodes:>8,} {avg_nps:>8,} {avg_time:>9,}"
         )
+    proc.stdin.write("quit\n")
+    proc.stdin.flush()
+    proc.wait(timeout=5)
+
     print()
     print("Run this script again after adding alpha-beta to measure node reduction.")
 
@@ -6,22 +6,39 @@ and time limit, runs the engine search, and returns the best move with score
 and depth information. Serves the chessboard.js frontend via static files.
 
 Architecture notes:
-- Sync endpoint (not async): FastAPI runs sync handlers in a thread pool,
-  which is the correct pattern for CPU-bound blocking calls like engine search.
+- Async endpoint, threaded search: the handler itself runs on the event loop
+  (validation, FEN parsing, and serialization are microseconds), and only the
+  CPU-bound engine search is offloaded to a worker thread, gated by a
+  dedicated capacity limiter so at most one search runs per core while the
+  shared thread pool stays free for other routes.
 - Static files mounted LAST: route registration is first-match, so API routes
   must be registered before the StaticFiles catch-all.
 - Stateless per request: the client sends the full FEN each time; no server-
   side board state is maintained between requests.
 """
 
+import asyncio
+import collections
+import functools
+import gzip
+import hashlib
 import logging
+import logging.handlers
+import mimetypes
+import os
+import queue
+import re
 import threading
 from pathlib import Path
 
+import anyio
+import anyio.to_thread
 import chess
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import Response
 from pydantic import BaseModel, field_validator
 
 from engine.search import get_best_move
@@ -30,8 +47,17 @@ from engine.search import get_best_move
 # Setup
 # ---------------------------------------------------------------------------
 
-logging.basicConfig(level=logging.INFO)
+# Log records are enqueued on the request path and written to stderr by a
+# dedicated listener thread, so a slow or blocked stderr (common on PaaS log
+# drains) never stalls a response. SimpleQueue.put is a few hundred ns and
+# never blocks.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
 _log = logging.getLogger(__name__)
+_log.setLevel(logging.INFO)
+_log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log.propagate = False
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
 
 # Absolute path resolved at import time — immune to working-directory changes.
 _STATIC_DIR = Path(__file__).parent / "static"
@@ -39,6 +65,87 @@ _STATIC_DIR = Path(__file__).parent / "static"
 app = FastAPI(title="Chess AI", version="4.0.0")
 
 
+def _json_response(payload: dict) -> Response:
+    """
+    Serialize a response dict with orjson in a single C call.
+
+    Returning a prebuilt Response also skips FastAPI's outbound model
+    revalidation and jsonable_encoder traversal — the payloads here are flat
+    str/int dicts that already match MoveResponse, which stays on the route
+    purely to document the schema in OpenAPI.
+    """
+    return Response(orjson.dumps(payload), media_type="application/json")
+
+# Cross-request move cache: repeated analysis of the same position with the
+# same budget (page refreshes, replayed games, multiple spectators) returns
+# the earlier result in O(1) instead of re-searching. Keyed by the position's
+# transposition key plus the budget rounded to 100 ms so trivially different
+# budgets still hit. The engine's transposition table is module-level and
+# already persists across requests, so even cache misses reuse prior search
+# effort; this cache only short-circuits exact repeats. LRU-bounded.
+_MOVE_CACHE: collections.OrderedDict = collections.OrderedDict()
+_MOVE_CACHE_LOCK = threading.Lock()
+_MOVE_CACHE_MAX_ENTRIES = 10_000
+
+# One concurrent search per CPU core. A search saturates a core for its whole
+# time budget, so letting the default 40-worker thread pool run 40 of them on
+# a 2-core host just context-switch-thrashes: every search crawls and the 90%
+# time cutoff fires before any useful depth. The dedicated limiter bounds
+# ONLY the search offload — the shared anyio pool stays at its default size,
+# so sync routes and other threadpool users never queue behind a search.
+_SEARCH_SLOTS = os.cpu_count() or 2
+_search_limiter = anyio.CapacityLimiter(_SEARCH_SLOTS)
+
+# In-flight coalescing: several clients asking for the same position at the
+# same time (spectators, a double-clicked button) share one search instead of
+# each burning a core. Maps cache key -> Future of the pending result. Only
+# touched from the event loop, so no lock is needed.
+_IN_FLIGHT: dict = {}
+
+
+# Structural FEN grammar: 8 piece-placement ranks, side to move, castling
+# rights, en-passant square, halfmove and fullmove counters. This only checks
+# SHAPE — chess.Board() still does the real legality work (rank sums, king
+# counts, impossible states). The point is to reject arbitrary garbage in
+# microseconds instead of letting it reach the much heavier parser.
+_FEN_RE = re.compile(
+    r"^(?:[rnbqkpRNBQKP1-8]{1,8}/){7}[rnbqkpRNBQKP1-8]{1,8}"
+    r" [wb] (?:-|K?Q?k?q?) (?:-|[a-h][36]) \d{1,3} \d{1,4}$"
+)
+
+
+def _fen_looks_valid(fen: str) -> bool:
+    """
+    Cheap structural screen for a FEN string before full parsing.
+
+    Matches the grammar regex, then checks that each rank's run lengths sum
+    to exactly 8 squares (the regex alone would accept e.g. "ppppppppp").
+    """
+    if _FEN_RE.match(fen) is None:
+        return False
+    for rank in fen.split(" ", 1)[0].split("/"):
+        squares = 0
+        for ch in rank:
+            squares += int(ch) if ch.isdigit() else 1
+        if squares != 8:
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_fen(fen: str) -> chess.Board:
+    """
+    Parse a FEN string into a Board, memoized on the exact string.
+
+    A client replaying a game sends back the FEN the server produced on the
+    previous call, so repeat strings are the common case. chess.Board()
+    re-tokenizes the string and rebuilds all bitboards each time; the LRU
+    cache turns repeats into a dict lookup. Callers MUST copy the returned
+    board before mutating it — cached entries are shared.
+    """
+    return chess.Board(fen)
+
+
 # ---------------------------------------------------------------------------
 # Request / response models
 # ---------------------------------------------------------------------------
@@ -58,12 +165,25 @@ class MoveRequest(BaseModel):
     fen: str
     time_limit: float = 1.0
 
+    @field_validator("fen")
+    @classmethod
+    def screen_fen(cls, v: str) -> str:
+        """Reject structurally malformed FEN strings before they reach chess.Board."""
+        if not _fen_looks_valid(v):
+            raise ValueError("malformed FEN")
+        return v
+
     @field_validator("time_limit")
     @classmethod
     def clamp_time_limit(cls, v: float) -> float:
         """Clamp time_limit to a safe operating range."""
         return max(0.1, min(v, 30.0))
 
+    @property
+    def time_limit_ms(self) -> int:
+        """Time budget in whole milliseconds, the unit the engine expects."""
+        return int(self.time_limit * 1000)
+
 
 class MoveResponse(BaseModel):
     """
@@ -89,7 +209,7 @@ class MoveResponse(BaseModel):
 
 
 @app.post("/api/move", response_model=MoveResponse)
-def api_move(request: MoveRequest) -> MoveResponse:
+async def api_move(request: MoveRequest) -> Response:
     """
     Compute the engine's best move for the given position.
 
@@ -109,11 +229,28 @@ def api_move(request: MoveRequest) -> MoveResponse:
                            non-terminal positions).
     """
     # --- Parse and validate the FEN ---
+    # copy(stack=False) detaches from the shared cached board without cloning
+    # its (empty) move history. The search mutates the copy via push/pop.
     try:
-        board = chess.Board(request.fen)
+        board = _parse_fen(request.fen).copy(stack=False)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid FEN: {exc}") from exc
 
+    # Cheap terminal screens first: is_game_over() generates legal moves, but
+    # a run-out fifty-move clock or bare kings (plus at most one minor piece)
+    # can be read straight off the FEN counters and bitboards. This matches
+    # the search, which also scores halfmove_clock >= 100 as a draw.
+    if board.halfmove_clock >= 100:
+        raise HTTPException(
+            status_code=400,
+            detail="Game is already over: draw by the fifty-move rule",
+        )
+    if chess.popcount(board.occupied) <= 3 and not (board.pawns | board.rooks | board.queens):
+        raise HTTPException(
+            status_code=400,
+            detail="Game is already over: draw by insufficient material",
+        )
+
     if board.is_game_over():
         reason = board.result()
         raise HTTPException(
@@ -121,49 +258,181 @@ def api_move(request: MoveRequest) -> MoveResponse:
             detail=f"Game is already over: {reason}",
         )
 
-    # --- Run the engine search ---
-    # A fresh stop_event is created per request. The engine self-terminates
-    # via TIME_USAGE_FRACTION (90% of the time budget), so we never need to
-    # set the event externally here.
-    stop_event = threading.Event()
-    time_limit_ms = int(request.time_limit * 1000)
+    time_limit_ms = request.time_limit_ms
+
+    # --- Cross-request cache probe ---
+    # The transposition key covers pieces, turn, castling, and en passant,
+    # but NOT the move counters — and the cached value embeds the post-move
+    # FEN, which is returned verbatim. The clocks must therefore be part of
+    # the key: without them a clock-30 request would receive a FEN minted
+    # from a clock-0 position (silently resetting the client's fifty-move
+    # state), and a move searched under a completely different draw horizon.
+    cache_key = (
+        board._transposition_key(),
+        board.halfmove_clock,
+        board.fullmove_number,
+        time_limit_ms // 100,
+    )
+    with _MOVE_CACHE_LOCK:
+        cached = _MOVE_CACHE.get(cache_key)
+        if cached is not None:
+            _MOVE_CACHE.move_to_end(cache_key)
+    if cached is not None:
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("Cache hit fen=%s", request.fen[:40])
+        return _json_response(cached)
+
+    # --- Coalesce with an identical in-flight search, if any ---
+    pending = _IN_FLIGHT.get(cache_key)
+    if pending is not None:
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("Joining in-flight search fen=%s", request.fen[:40])
+        return _json_response(await asyncio.shield(pending))
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _IN_FLIGHT[cache_key] = future
 
     try:
-        move, score, depth, nodes = get_best_move(board, time_limit_ms, stop_event)
-    except Exception as exc:
-        _log.exception("Engine search failed for FEN=%s", request.fen)
-        raise HTTPException(status_code=500, detail=f"Engine error: {exc}") from exc
-
-    if move is None:
-        raise HTTPException(status_code=500, detail="Engine returned no move")
-
-    _log.info(
-        "Move=%s score=%d depth=%d nodes=%d fen=%s",
-        move.uci(),
-        score,
-        depth,
-        nodes,
-        request.fen[:40],
-    )
+        try:
+            # Offload only the CPU-bound search to a worker thread; everything
+            # else in this handler stays on the event loop. The dedicated
+            # limiter queues excess clients rather than oversubscribing the
+            # cores, without shrinking the shared pool other routes use.
+            # No stop event: the web path never interrupts a search, so the
+            # engine falls back to its shared never-set default.
+            move, score, depth, nodes = await anyio.to_thread.run_sync(
+                get_best_move, board, time_limit_ms, limiter=_search_limiter
+            )
+        except Exception as exc:
+            _log.exception("Engine search failed for FEN=%s", request.fen)
+            raise HTTPException(status_code=500, detail=f"Engine error: {exc}") from exc
+
+        if move is None:
+            raise HTTPException(status_code=500, detail="Engine returned no move")
+
+        # Gate on the level so the uci()/slice argument work is skipped
+        # entirely when INFO logging is turned off.
+        if _log.isEnabledFor(logging.INFO):
+            _log.info(
+                "Move=%s score=%d depth=%d nodes=%d fen=%s",
+                move.uci(),
+                score,
+                depth,
+                nodes,
+                request.fen[:40],
+            )
+
+        # --- Apply the move, cache, and return ---
+        board.push(move)
+        result = {
+            "move": move.uci(),
+            "fen": board.fen(),
+            "score": score,
+            "depth": depth,
+        }
+        with _MOVE_CACHE_LOCK:
+            _MOVE_CACHE[cache_key] = result
+            if len(_MOVE_CACHE) > _MOVE_CACHE_MAX_ENTRIES:
+                _MOVE_CACHE.popitem(last=False)  # evict least recently used
+    except BaseException as exc:
+        # Propagate the failure to any coalesced waiters, then mark it
+        # retrieved so the loop doesn't warn when there are none.
+        future.set_exception(exc)
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        _IN_FLIGHT.pop(cache_key, None)
+    return _json_response(result)
 
-    # --- Apply the move and return ---
-    board.push(move)
-    return MoveResponse(
-        move=move.uci(),
-        fen=board.fen(),
-        score=score,
-        depth=depth,
-    )
+
+# ---------------------------------------------------------------------------
+# Static file serving
+# ---------------------------------------------------------------------------
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves text assets from memory, gzipped, with ETags.
+
+    The frontend bundle (index.html, main.js, style.css) is small and never
+    changes while the server runs, yet the stock StaticFiles re-reads it from
+    disk and sends it uncompressed on every page load. At startup this class
+    reads each text asset once, gzips it, and hashes it for an ETag. Requests
+    are then answered straight from memory: a 304 if the client already has
+    the current bytes, the gzip variant if it accepts that encoding, the raw
+    bytes otherwise. Anything not precompressed (e.g. images added later)
+    falls through to the normal StaticFiles disk path.
+    """
+
+    #: Suffixes worth compressing — binary formats are already compressed.
+    _TEXT_SUFFIXES = {".html", ".js", ".css", ".svg", ".json"}
+
+    def __init__(self, directory: Path) -> None:
+        super().__init__(directory=directory)
+        self._assets: dict[str, tuple[bytes, bytes | None, str, str]] = {}
+        for path in sorted(directory.rglob("*")):
+            if not (path.is_file() and path.suffix in self._TEXT_SUFFIXES):
+                continue
+            raw = path.read_bytes()
+            compressed = gzip.compress(raw, compresslevel=9)
+            etag = f'"{hashlib.md5(raw).hexdigest()}"'
+            media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            self._assets[path.relative_to(directory).as_posix()] = (
+                raw,
+                # Keep the gzip variant only if it actually saves bytes.
+                compressed if len(compressed) < len(raw) else None,
+                etag,
+                media_type,
+            )
+
+    def build_response(self, rel_path: str, request_headers: Headers) -> Response | None:
+        """Build an in-memory response for rel_path, or None if not cached."""
+        asset = self._assets.get(rel_path)
+        if asset is None:
+            return None
+        raw, compressed, etag, media_type = asset
+        # Assets are not content-hash named, so clients must revalidate after
+        # max-age; the ETag turns most revalidations into empty 304 replies.
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "public, max-age=3600",
+            "Vary": "Accept-Encoding",
+        }
+        if request_headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        if compressed is not None and "gzip" in request_headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return Response(compressed, media_type=media_type, headers=headers)
+        return Response(raw, media_type=media_type, headers=headers)
+
+    async def get_response(self, path: str, scope) -> Response:
+        response = self.build_response(path, Headers(scope=scope))
+        if response is not None:
+            return response
+        return await super().get_response(path, scope)
+
+
+_static_files = PrecompressedStaticFiles(_STATIC_DIR)
 
 
 @app.get("/", include_in_schema=False)
-def serve_root() -> FileResponse:
-    """Serve the main chessboard UI."""
-    return FileResponse(_STATIC_DIR / "index.html")
+async def serve_root(request: Request) -> Response:
+    """
+    Serve the main chessboard UI from the precompressed asset cache.
+
+    Async on purpose: the response is built from in-memory bytes, so there
+    is no blocking work to offload — a sync def would route every page load
+    through the worker-thread pool for nothing.
+    """
+    response = _static_files.build_response("index.html", request.headers)
+    if response is None:  # pragma: no cover — index.html always exists
+        raise HTTPException(status_code=404, detail="index.html missing")
+    return response
 
 
 # ---------------------------------------------------------------------------
 # Static file mount — MUST be last (catch-all for /static/* assets)
 # ---------------------------------------------------------------------------
 
-app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
+app.mount("/static", _static_files, name="static")